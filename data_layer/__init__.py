@@ -10,6 +10,7 @@ from .models.ticker_overview import TickerOverview
 from .repositories.ticker_summary_repository import TickerSummaryRepository
 from .repositories.ticker_overview_repository import TickerOverviewRepository
 from .database.connection_manager import DatabaseConnectionManager
+from .database.async_connection_manager import AsyncDatabaseConnectionManager
 from .exceptions import (
     DataLayerError,
     DatabaseConnectionError,
@@ -26,6 +27,7 @@ __all__ = [
     "TickerSummaryRepository",
     "TickerOverviewRepository",
     "DatabaseConnectionManager",
+    "AsyncDatabaseConnectionManager",
     "DataLayerError",
     "DatabaseConnectionError",
     "DatabaseQueryError",
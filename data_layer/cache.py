@@ -0,0 +1,125 @@
+"""
+In-process caching for repository lookups.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Protocol, Tuple, TypeVar
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class Cache(Protocol[K, V]):
+    """
+    Interface repositories use for their lookup caches.
+    TTLCache is the in-process default; a shared backend (e.g. Redis) can be
+    passed to a repository instead so several workers see the same entries.
+    """
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value."""
+        ...
+
+    def invalidate(self, key: K) -> None:
+        """Remove a key if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is cached and not expired."""
+        ...
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded least-recently-used cache whose entries expire after a fixed time-to-live.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used entry is evicted beyond this
+            ttl: Seconds an entry stays valid after it is set
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if the key is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Cache a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove a key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is cached and not expired."""
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        """Number of stored entries, including any not yet purged after expiry."""
+        return len(self._entries)
@@ -3,5 +3,6 @@ Database package initialization.
 """
 
 from .connection_manager import DatabaseConnectionManager
+from .async_connection_manager import AsyncDatabaseConnectionManager
 
-__all__ = ["DatabaseConnectionManager"]
\ No newline at end of file
+__all__ = ["DatabaseConnectionManager", "AsyncDatabaseConnectionManager"]
\ No newline at end of file
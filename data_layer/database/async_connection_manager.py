@@ -0,0 +1,158 @@
+"""
+Async database connection manager for PostgreSQL.
+"""
+
+import os
+import asyncio
+import logging
+from typing import Optional, Any, AsyncGenerator
+from contextlib import asynccontextmanager
+from psycopg_pool import AsyncConnectionPool
+from psycopg import AsyncConnection
+
+from ..exceptions import DatabaseConnectionError
+
+
+class AsyncDatabaseConnectionManager:
+    """
+    Manages asynchronous PostgreSQL database connections with connection pooling.
+    Mirrors DatabaseConnectionManager for callers running on an event loop.
+    """
+
+    def __init__(self,
+                 connection_string: Optional[str] = None,
+                 min_connections: int = 5,
+                 max_connections: int = 20,
+                 prepare_threshold: Optional[int] = 1):
+        """
+        Initialize the async database connection manager.
+
+        Args:
+            connection_string: PostgreSQL connection string. If None, reads from DATABASE_URL env var.
+            min_connections: Minimum number of connections kept open in the pool.
+            max_connections: Maximum number of connections in the pool.
+            prepare_threshold: Executions of a statement on a connection before psycopg
+                               prepares it server-side (None disables automatic preparing).
+        """
+        self.logger = logging.getLogger(__name__)
+
+        # Get connection string from parameter or environment
+        self.connection_string = connection_string or os.getenv('DATABASE_URL')
+        if not self.connection_string:
+            raise DatabaseConnectionError(
+                "No database connection string provided. Set DATABASE_URL environment variable "
+                "or pass connection_string parameter."
+            )
+
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.prepare_threshold = prepare_threshold
+        self._connection_pool: Optional[AsyncConnectionPool[AsyncConnection[Any]]] = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _create_pool(self) -> None:
+        """Create and open the connection pool."""
+        if not self.connection_string:
+            raise DatabaseConnectionError("Connection string is required")
+
+        try:
+            pool: AsyncConnectionPool[AsyncConnection[Any]] = AsyncConnectionPool(
+                conninfo=self.connection_string,
+                min_size=self.min_connections,
+                max_size=self.max_connections,
+                kwargs={
+                    'prepare_threshold': self.prepare_threshold,
+                    # TCP keepalives stop NATs and load balancers from silently dropping idle
+                    # pooled connections, which would otherwise fail on their next checkout
+                    'keepalives': 1,
+                    'keepalives_idle': 60,
+                },
+                open=False
+            )
+            # Wait for min_size connections so the first requests don't pay connect/auth latency
+            await pool.open(wait=True)
+            self._connection_pool = pool
+            self.logger.info(f"Created async connection pool with {self.min_connections}-{self.max_connections} connections")
+        except Exception as e:
+            raise DatabaseConnectionError(f"Failed to create async connection pool: {e}")
+
+    async def _get_pool(self) -> AsyncConnectionPool[AsyncConnection[Any]]:
+        """
+        Get the connection pool, creating it on first use.
+
+        Returns:
+            psycopg_pool.AsyncConnectionPool: The open connection pool
+        """
+        if self._connection_pool is None:
+            async with self._pool_lock:
+                if self._connection_pool is None:
+                    await self._create_pool()
+
+        if self._connection_pool is None:
+            raise DatabaseConnectionError("Connection pool not initialized")
+
+        return self._connection_pool
+
+    @asynccontextmanager
+    async def get_connection_context(self) -> AsyncGenerator[AsyncConnection[Any], None]:
+        """
+        Async context manager for database connections.
+        Commits on success, rolls back on error and returns the connection to the pool.
+
+        Yields:
+            psycopg.AsyncConnection: Database connection
+        """
+        pool = await self._get_pool()
+
+        async with pool.connection() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def get_cursor_context(self,
+                                 commit: bool = True,
+                                 row_factory: Optional[Any] = None) -> AsyncGenerator[Any, None]:
+        """
+        Async context manager for database cursor with automatic connection management.
+
+        Args:
+            commit: Whether to commit the transaction automatically
+            row_factory: psycopg row factory for the cursor (tuples if None)
+
+        Yields:
+            psycopg.AsyncCursor: Database cursor
+        """
+        pool = await self._get_pool()
+
+        # pool.connection() rolls back on error and commits on a clean exit, so the
+        # connection never goes back to the pool with a transaction still open
+        async with pool.connection() as conn:
+            async with conn.cursor(row_factory=row_factory) as cursor:
+                yield cursor
+            if not commit:
+                await conn.rollback()
+
+    async def test_connection(self) -> bool:
+        """
+        Test the database connection.
+
+        Returns:
+            bool: True if connection is successful, False otherwise
+        """
+        try:
+            async with self.get_cursor_context() as cursor:
+                await cursor.execute("SELECT 1")
+                result = await cursor.fetchone()
+                return result is not None and result[0] == 1
+        except Exception as e:
+            self.logger.error(f"Database connection test failed: {e}")
+            return False
+
+    async def close_all_connections(self) -> None:
+        """Close all connections in the pool."""
+        if self._connection_pool:
+            try:
+                await self._connection_pool.close()
+                self._connection_pool = None
+                self.logger.info("Closed all async database connections")
+            except Exception as e:
+                self.logger.error(f"Error closing async connections: {e}")
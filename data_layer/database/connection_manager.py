@@ -20,7 +20,8 @@ class DatabaseConnectionManager:
     def __init__(self, 
                  connection_string: Optional[str] = None,
                  min_connections: int = 1,
-                 max_connections: int = 10):
+                 max_connections: int = 10,
+                 prepare_threshold: Optional[int] = 1):
         """
         Initialize the database connection manager.
         
@@ -28,6 +29,8 @@ class DatabaseConnectionManager:
             connection_string: PostgreSQL connection string. If None, reads from DATABASE_URL env var.
             min_connections: Minimum number of connections in the pool.
             max_connections: Maximum number of connections in the pool.
+            prepare_threshold: Executions of a statement on a connection before psycopg
+                               prepares it server-side (None disables automatic preparing).
         """
         self.logger = logging.getLogger(__name__)
         
@@ -41,6 +44,7 @@ class DatabaseConnectionManager:
         
         self.min_connections = min_connections
         self.max_connections = max_connections
+        self.prepare_threshold = prepare_threshold
         self._connection_pool: Optional[ConnectionPool[Connection[Any]]] = None
         
     def _create_pool(self) -> None:
@@ -53,8 +57,17 @@ class DatabaseConnectionManager:
                 conninfo=self.connection_string,
                 min_size=self.min_connections,
                 max_size=self.max_connections,
+                kwargs={
+                    'prepare_threshold': self.prepare_threshold,
+                    # TCP keepalives stop NATs and load balancers from silently dropping idle
+                    # pooled connections, which would otherwise fail on their next checkout
+                    'keepalives': 1,
+                    'keepalives_idle': 60,
+                },
                 open=True
             )
+            # Wait for min_size connections so the first queries don't pay connect/auth latency
+            self._connection_pool.wait()
             self.logger.info(f"Created connection pool with {self.min_connections}-{self.max_connections} connections")
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to create connection pool: {e}")
@@ -116,12 +129,15 @@ class DatabaseConnectionManager:
                 self.return_connection(conn)
     
     @contextmanager
-    def get_cursor_context(self, commit: bool = True) -> Generator[Any, None, None]:
+    def get_cursor_context(self,
+                           commit: bool = True,
+                           row_factory: Optional[Any] = None) -> Generator[Any, None, None]:
         """
         Context manager for database cursor with automatic connection management.
         
         Args:
             commit: Whether to commit the transaction automatically
+            row_factory: psycopg row factory for the cursor (tuples if None)
         
         Yields:
             psycopg.Cursor: Database cursor
@@ -130,7 +146,7 @@ class DatabaseConnectionManager:
         cursor = None
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
+            cursor = conn.cursor(row_factory=row_factory)
             yield cursor
             if commit:
                 conn.commit()
@@ -169,14 +185,9 @@ class DatabaseConnectionManager:
         """
         try:
             with self.get_cursor_context() as cursor:
-                cursor.execute("SELECT version()")
-                version = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT current_database()")
-                database = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT current_user")
-                user = cursor.fetchone()[0]
+                # One round trip for all three values
+                cursor.execute("SELECT version(), current_database(), current_user")
+                version, database, user = cursor.fetchone()
                 
                 return {
                     'version': version,
@@ -0,0 +1,25 @@
+-- Maintain last_updated_at with BEFORE UPDATE triggers on cik_lookup and ticker_directory.
+-- The repositories no longer set last_updated_at in their UPDATE statements, so
+-- without these triggers the column would silently stop changing.
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION set_last_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.last_updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS cik_lookup_set_last_updated_at ON cik_lookup;
+CREATE TRIGGER cik_lookup_set_last_updated_at
+    BEFORE UPDATE ON cik_lookup
+    FOR EACH ROW EXECUTE FUNCTION set_last_updated_at();
+
+DROP TRIGGER IF EXISTS ticker_directory_set_last_updated_at ON ticker_directory;
+CREATE TRIGGER ticker_directory_set_last_updated_at
+    BEFORE UPDATE ON ticker_directory
+    FOR EACH ROW EXECUTE FUNCTION set_last_updated_at();
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- Add cik_lookup.company_name_lower and move the company name search indexes onto it.
+-- CikLookupRepository and AsyncCikLookupRepository filter on this column, so it must
+-- exist before they are deployed.
+-- Idempotent: safe to re-run. Uses CONCURRENTLY, so run outside a transaction block.
+
+-- Adding a stored generated column rewrites the table once
+ALTER TABLE cik_lookup
+    ADD COLUMN IF NOT EXISTS company_name_lower TEXT
+    GENERATED ALWAYS AS (lower(company_name::text)) STORED;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- The column indexes get new names, so IF NOT EXISTS can't mistake the old
+-- lower(company_name) expression indexes for them
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cik_lookup_company_name_lower_col
+    ON cik_lookup (company_name_lower);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cik_lookup_company_name_lower_col_trgm
+    ON cik_lookup USING gin (company_name_lower gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cik_lookup_company_name_lower_col_pattern
+    ON cik_lookup (company_name_lower text_pattern_ops);
+
+-- The expression indexes no longer match any query
+DROP INDEX CONCURRENTLY IF EXISTS idx_cik_lookup_company_name_lower;
+DROP INDEX CONCURRENTLY IF EXISTS idx_cik_lookup_company_name_lower_trgm;
+DROP INDEX CONCURRENTLY IF EXISTS idx_cik_lookup_company_name_lower_pattern;
@@ -0,0 +1,20 @@
+-- Enforce upper-case tickers on ticker_summary, matching the CHECK in the schema script.
+-- Added NOT VALID first so existing rows aren't checked under the ACCESS EXCLUSIVE
+-- lock; VALIDATE then scans them holding only a SHARE UPDATE EXCLUSIVE lock.
+-- VALIDATE fails if any stored ticker isn't upper-case; fix those rows and re-run.
+-- Idempotent: safe to re-run.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'ticker_summary_ticker_upper'
+          AND conrelid = 'ticker_summary'::regclass
+    ) THEN
+        ALTER TABLE ticker_summary
+            ADD CONSTRAINT ticker_summary_ticker_upper CHECK (ticker = upper(ticker)) NOT VALID;
+    END IF;
+END
+$$;
+
+ALTER TABLE ticker_summary VALIDATE CONSTRAINT ticker_summary_ticker_upper;
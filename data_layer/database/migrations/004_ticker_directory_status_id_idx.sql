@@ -0,0 +1,6 @@
+-- Index ticker_directory by (status, id) for get_by_status and count_by_status,
+-- matching ticker_directory_status_id_idx in the schema script.
+-- Idempotent: safe to re-run. Uses CONCURRENTLY, so run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ticker_directory_status_id_idx
+    ON ticker_directory (status, id);
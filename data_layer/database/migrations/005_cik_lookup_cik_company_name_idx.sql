@@ -0,0 +1,10 @@
+-- Index cik_lookup by cik including company_name, so get_company_name_by_cik is an
+-- index-only scan, matching idx_cik_lookup_cik_company_name in the schema script.
+-- Idempotent: safe to re-run. Uses CONCURRENTLY, so run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cik_lookup_cik_company_name
+    ON cik_lookup (cik) INCLUDE (company_name);
+
+-- Databases created from an earlier schema script may have the wider covering
+-- index it replaces
+DROP INDEX CONCURRENTLY IF EXISTS idx_cik_lookup_cik_covering;
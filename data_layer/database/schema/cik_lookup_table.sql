@@ -5,14 +5,40 @@ CREATE TABLE cik_lookup (
     last_updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     company_name CHARACTER VARYING(255) NOT NULL DEFAULT 'Company'::character varying,
     company_name_search CHARACTER VARYING(255),
+    -- Lower-cased company_name, stored so searches don't apply LOWER() per row
+    company_name_lower TEXT GENERATED ALWAYS AS (lower(company_name::text)) STORED,
     CONSTRAINT idx_cik_lookup_cik PRIMARY KEY (cik)
 );
 
--- Index to support case-insensitive lookups on company_name
-CREATE INDEX IF NOT EXISTS idx_cik_lookup_company_name_lower
-    ON cik_lookup (lower(company_name::text));
+-- Index to support case-insensitive exact lookups on company_name
+CREATE INDEX IF NOT EXISTS idx_cik_lookup_company_name_lower_col
+    ON cik_lookup (company_name_lower);
 
 -- Trigram GIN index for fast similarity / partial matching on company_name
--- Requires the pg_trgm extension to be available in the database
-CREATE INDEX IF NOT EXISTS idx_cik_lookup_company_name_lower_trgm
-    ON cik_lookup USING gin (lower(company_name::text) gin_trgm_ops);
+-- Serves the company_name_lower LIKE '%...%' searches in CikLookupRepository
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_cik_lookup_company_name_lower_col_trgm
+    ON cik_lookup USING gin (company_name_lower gin_trgm_ops);
+
+-- Covering index so get_company_name_by_cik can be answered by an index-only scan;
+-- uniqueness is already enforced by the primary key, which also serves get_by_cik
+CREATE INDEX IF NOT EXISTS idx_cik_lookup_cik_company_name
+    ON cik_lookup (cik) INCLUDE (company_name);
+
+-- Pattern-ops index for left-anchored (prefix) LIKE searches on company_name;
+-- the default B-tree above cannot serve LIKE under a non-C collation
+CREATE INDEX IF NOT EXISTS idx_cik_lookup_company_name_lower_col_pattern
+    ON cik_lookup (company_name_lower text_pattern_ops);
+
+-- Keep last_updated_at current on every UPDATE, so writers never set it themselves
+CREATE OR REPLACE FUNCTION set_last_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.last_updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER cik_lookup_set_last_updated_at
+    BEFORE UPDATE ON cik_lookup
+    FOR EACH ROW EXECUTE FUNCTION set_last_updated_at();
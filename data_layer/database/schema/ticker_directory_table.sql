@@ -18,3 +18,18 @@ CREATE TABLE ticker_directory (
 -- Create indexes
 CREATE INDEX ticker_directory_cik_idx ON ticker_directory (cik);
 CREATE INDEX ticker_directory_ticker_idx ON ticker_directory (ticker);
+-- Serves get_by_status (WHERE status = %s ORDER BY id LIMIT ...) and count_by_status
+-- without scanning the table or sorting
+CREATE INDEX ticker_directory_status_id_idx ON ticker_directory (status, id);
+
+-- Keep last_updated_at current on every UPDATE, so writers never set it themselves
+CREATE OR REPLACE FUNCTION set_last_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.last_updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ticker_directory_set_last_updated_at
+    BEFORE UPDATE ON ticker_directory
+    FOR EACH ROW EXECUTE FUNCTION set_last_updated_at();
@@ -13,6 +13,9 @@ CREATE TABLE ticker_summary (
     annual_dividend_growth NUMERIC(5,2),
     five_year_avg_dividend_yield NUMERIC(5,2),
     CONSTRAINT idx_ticker_summary_ticker PRIMARY KEY (ticker),
+    -- Tickers are stored upper-cased, so lookups compare ticker = %s against the
+    -- primary key instead of wrapping the column in UPPER() and scanning
+    CONSTRAINT ticker_summary_ticker_upper CHECK (ticker = upper(ticker)),
     CONSTRAINT cik FOREIGN KEY (cik) REFERENCES cik_lookup(cik)
 );
 
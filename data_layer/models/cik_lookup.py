@@ -9,7 +9,7 @@ from typing import Optional, Dict, Any
 from ..exceptions import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class CikLookup:
     """
     Represents a CIK lookup entity with validation.
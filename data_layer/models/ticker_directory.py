@@ -17,7 +17,7 @@ class TickerDirectoryStatus(str, Enum):
     INACTIVE = "INACTIVE"
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerDirectory:
     """
     Represents a ticker directory entity with validation.
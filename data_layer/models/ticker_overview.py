@@ -6,13 +6,14 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from decimal import Decimal
 import logging
+import sys
 
 from ..exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerOverview:
     """
     Represents a ticker overview entity with validation.
@@ -45,8 +46,8 @@ class TickerOverview:
     
     def __post_init__(self):
         """Clean and validate the ticker overview data after initialization."""
-        # Clean ticker
-        self.ticker = self.ticker.strip().upper()
+        # Clean ticker; interned so the same symbol read from several tables shares one string
+        self.ticker = sys.intern(self.ticker.strip().upper())
         self.validate()
     
     def validate(self):
@@ -12,7 +12,7 @@ from ..exceptions import ValidationError
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerSummary:
     """
     Represents a ticker summary entity with validation.
@@ -4,16 +4,22 @@ Repositories package initialization.
 
 from .base_repository import BaseRepository
 from .cik_lookup_repository import CikLookupRepository, CikLookupNotFoundError, DuplicateCikError
+from .async_cik_lookup_repository import AsyncCikLookupRepository
 from .ticker_summary_repository import TickerSummaryRepository, TickerSummaryNotFoundError, DuplicateTickerError
+from .async_ticker_summary_repository import AsyncTickerSummaryRepository
 from .ticker_directory_repository import TickerDirectoryRepository, TickerDirectoryNotFoundError, DuplicateTickerDirectoryError
+from .async_ticker_directory_repository import AsyncTickerDirectoryRepository
 from .ticker_overview_repository import TickerOverviewRepository, TickerOverviewNotFoundError, DuplicateTickerError as DuplicateTickerOverviewError
 
 __all__ = [
     "BaseRepository", 
     
     "CikLookupRepository",
+    "AsyncCikLookupRepository",
     "TickerSummaryRepository",
+    "AsyncTickerSummaryRepository",
     "TickerDirectoryRepository",
+    "AsyncTickerDirectoryRepository",
     "TickerOverviewRepository",
     "CikLookupNotFoundError",
     "DuplicateCikError",
@@ -0,0 +1,180 @@
+"""
+Async CIK lookup repository for database operations.
+"""
+
+import logging
+from typing import List, Optional
+
+from .base_repository import BULK_CHUNK_SIZE
+from .cik_lookup_repository import (
+    CIK_LOOKUP_ROW_FACTORY,
+    COUNT_QUERY,
+    EXISTS_QUERY,
+    SELECT_BY_CIK_QUERY,
+    column_arrays,
+    company_name_search_query
+)
+from ..models.cik_lookup import CikLookup
+from ..database.async_connection_manager import AsyncDatabaseConnectionManager
+from ..exceptions import DatabaseQueryError
+
+
+class AsyncCikLookupRepository:
+    """
+    Async repository for CIK lookup entities.
+    Covers the read paths a web request fans out to (get, search, count, exists)
+    plus bulk insert, so independent queries can run concurrently on the pool.
+    The synchronous CikLookupRepository remains the API for the sync jobs.
+    """
+    
+    def __init__(self, db_manager: AsyncDatabaseConnectionManager):
+        """
+        Initialize the async CIK lookup repository.
+        
+        Args:
+            db_manager: Async database connection manager instance
+        """
+        self.db_manager = db_manager
+        self.logger = logging.getLogger(__name__)
+        self.table_name = "cik_lookup"
+    
+    # ============================================================================
+    # CREATE OPERATIONS
+    # ============================================================================
+    
+    async def bulk_insert(self, entities: List[CikLookup]) -> int:
+        """
+        Insert multiple CIK lookup entries in a single transaction.
+        Skips entries that already exist (uses ON CONFLICT DO NOTHING).
+        
+        Args:
+            entities: List of CikLookup entities to insert
+        
+        Returns:
+            Number of rows successfully inserted
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not entities:
+            return 0
+        
+        insert_query = """
+        INSERT INTO cik_lookup (cik, company_name, company_name_search)
+        SELECT * FROM unnest(%s::integer[], %s::varchar[], %s::varchar[])
+        ON CONFLICT (cik) DO NOTHING;
+        """
+        
+        try:
+            async with self.db_manager.get_cursor_context() as cursor:
+                total_inserted = 0
+
+                for start in range(0, len(entities), BULK_CHUNK_SIZE):
+                    chunk = entities[start:start + BULK_CHUNK_SIZE]
+                    await cursor.execute(insert_query, column_arrays(chunk))
+                    total_inserted += cursor.rowcount
+
+                self.logger.info(f"Bulk inserted {total_inserted} new CIK lookups")
+                return total_inserted
+
+        except Exception as e:
+            raise DatabaseQueryError("bulk insert CIK lookups", str(e))
+    
+    # ============================================================================
+    # READ OPERATIONS
+    # ============================================================================
+    
+    async def get_by_cik(self, cik: int) -> Optional[CikLookup]:
+        """
+        Retrieve a CIK lookup entry by its CIK (primary key).
+        
+        Args:
+            cik: The CIK to retrieve
+        
+        Returns:
+            CikLookup if found, None otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(
+                commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY
+            ) as cursor:
+                await cursor.execute(SELECT_BY_CIK_QUERY, (cik,), prepare=True)
+                return await cursor.fetchone()
+
+        except Exception as e:
+            self.logger.error(f"Error retrieving CIK lookup by CIK {cik}: {e}")
+            raise DatabaseQueryError("get CIK lookup by CIK", str(e))
+    
+    async def search_by_company_name(self, company_name: str, limit: int = 10) -> List[CikLookup]:
+        """
+        Search for CIK lookup entries by company name (partial or fuzzy match).
+        Results are ranked by trigram similarity to the search term.
+        
+        Args:
+            company_name: The company name to search for
+            limit: Maximum number of results to return
+        
+        Returns:
+            List of matching CikLookup entries, most similar first
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        select_query, params = company_name_search_query(company_name, limit)
+        
+        try:
+            async with self.db_manager.get_cursor_context(
+                commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY
+            ) as cursor:
+                await cursor.execute(select_query, params)
+                return await cursor.fetchall()
+
+        except Exception as e:
+            self.logger.error(f"Error searching CIK lookup by company name {company_name}: {e}")
+            raise DatabaseQueryError("search CIK lookup by company name", str(e))
+    
+    async def count(self) -> int:
+        """
+        Count the total number of CIK lookup entries.
+        
+        Returns:
+            Total count of entries
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(COUNT_QUERY, prepare=True)
+                result = await cursor.fetchone()
+                return result[0] if result else 0
+
+        except Exception as e:
+            self.logger.error(f"Error counting CIK lookups: {e}")
+            raise DatabaseQueryError("count CIK lookups", str(e))
+    
+    async def exists(self, cik: int) -> bool:
+        """
+        Check if a CIK exists in the database.
+        
+        Args:
+            cik: The CIK to check
+        
+        Returns:
+            True if the CIK exists, False otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(EXISTS_QUERY, (cik,), prepare=True)
+                result = await cursor.fetchone()
+                return bool(result[0]) if result else False
+
+        except Exception as e:
+            self.logger.error(f"Error checking if CIK {cik} exists: {e}")
+            raise DatabaseQueryError("check CIK exists", str(e))
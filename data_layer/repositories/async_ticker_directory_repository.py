@@ -0,0 +1,181 @@
+"""
+Async ticker directory repository for database operations.
+"""
+
+import logging
+from typing import List, Optional
+
+from .base_repository import BULK_CHUNK_SIZE
+from .ticker_directory_repository import (
+    COUNT_QUERY,
+    EXISTS_QUERY,
+    SELECT_BY_CIK_QUERY,
+    SELECT_BY_TICKER_QUERY,
+    TICKER_DIRECTORY_ROW_FACTORY,
+    column_arrays
+)
+from ..models.ticker_directory import TickerDirectory
+from ..database.async_connection_manager import AsyncDatabaseConnectionManager
+from ..exceptions import DatabaseQueryError
+
+
+class AsyncTickerDirectoryRepository:
+    """
+    Async repository for ticker directory entities.
+    Covers the read paths a web request fans out to (get by ticker or CIK, count, exists)
+    plus bulk insert, so independent queries can run concurrently on the pool.
+    The synchronous TickerDirectoryRepository remains the API for the sync jobs.
+    """
+    
+    def __init__(self, db_manager: AsyncDatabaseConnectionManager):
+        """
+        Initialize the async ticker directory repository.
+        
+        Args:
+            db_manager: Async database connection manager instance
+        """
+        self.db_manager = db_manager
+        self.logger = logging.getLogger(__name__)
+        self.table_name = "ticker_directory"
+    
+    # ============================================================================
+    # CREATE OPERATIONS
+    # ============================================================================
+    
+    async def bulk_insert(self, entities: List[TickerDirectory]) -> int:
+        """
+        Insert multiple ticker directory entries in a single transaction.
+        Skips entries that already exist (uses ON CONFLICT DO NOTHING on cik and ticker).
+        The generated id and timestamps of each inserted row are copied back onto
+        its entity.
+        
+        Args:
+            entities: List of TickerDirectory entities to insert
+        
+        Returns:
+            Number of rows successfully inserted
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not entities:
+            return 0
+        
+        insert_query = """
+        INSERT INTO ticker_directory (ticker, cik, status)
+        SELECT * FROM unnest(%s::varchar[], %s::integer[], %s::ticker_directory_status[])
+        ON CONFLICT (cik, ticker) DO NOTHING
+        RETURNING cik, ticker, id, created_at, last_updated_at;
+        """
+        
+        try:
+            async with self.db_manager.get_cursor_context() as cursor:
+                entities_by_key = {(td.cik, td.ticker): td for td in entities}
+                rows_inserted = 0
+
+                for start in range(0, len(entities), BULK_CHUNK_SIZE):
+                    chunk = entities[start:start + BULK_CHUNK_SIZE]
+                    await cursor.execute(insert_query, column_arrays(chunk))
+
+                    for cik, ticker, entry_id, created_at, last_updated_at in await cursor.fetchall():
+                        entity = entities_by_key[(cik, ticker)]
+                        entity.id = entry_id
+                        entity.created_at = created_at
+                        entity.last_updated_at = last_updated_at
+                        rows_inserted += 1
+
+                self.logger.info(f"Successfully bulk inserted {rows_inserted} ticker directory entries")
+                return rows_inserted
+
+        except Exception as e:
+            raise DatabaseQueryError("bulk insert ticker directory", str(e))
+    
+    # ============================================================================
+    # READ OPERATIONS
+    # ============================================================================
+    
+    async def get_by_ticker(self, ticker: str) -> Optional[TickerDirectory]:
+        """
+        Retrieve a ticker directory entry by its ticker symbol.
+        
+        Args:
+            ticker: The ticker symbol to retrieve
+        
+        Returns:
+            TickerDirectory if found, None otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(
+                commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY
+            ) as cursor:
+                await cursor.execute(SELECT_BY_TICKER_QUERY, (ticker.upper(),), prepare=True)
+                return await cursor.fetchone()
+
+        except Exception as e:
+            raise DatabaseQueryError("get ticker directory by ticker", str(e))
+    
+    async def get_by_cik(self, cik: int) -> Optional[TickerDirectory]:
+        """
+        Retrieve a ticker directory entry by its CIK.
+        
+        Args:
+            cik: The CIK to retrieve
+        
+        Returns:
+            TickerDirectory if found, None otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(
+                commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY
+            ) as cursor:
+                await cursor.execute(SELECT_BY_CIK_QUERY, (cik,), prepare=True)
+                return await cursor.fetchone()
+
+        except Exception as e:
+            raise DatabaseQueryError("get ticker directory by CIK", str(e))
+    
+    async def count(self) -> int:
+        """
+        Count the total number of ticker directory entries.
+        
+        Returns:
+            Total count of entries
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(COUNT_QUERY, prepare=True)
+                result = await cursor.fetchone()
+                return result[0] if result else 0
+
+        except Exception as e:
+            raise DatabaseQueryError("count ticker directory entries", str(e))
+    
+    async def exists(self, ticker: str) -> bool:
+        """
+        Check if a ticker directory entry exists by ticker.
+        
+        Args:
+            ticker: The ticker to check
+        
+        Returns:
+            True if the entry exists, False otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(EXISTS_QUERY, (ticker.upper(),), prepare=True)
+                return await cursor.fetchone() is not None
+
+        except Exception as e:
+            raise DatabaseQueryError("check ticker directory existence", str(e))
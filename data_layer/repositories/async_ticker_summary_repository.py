@@ -0,0 +1,169 @@
+"""
+Async ticker summary repository for database operations.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from psycopg.rows import dict_row
+
+from .base_repository import BULK_CHUNK_SIZE
+from .ticker_summary_repository import (
+    BULK_INSERT_QUERY,
+    COUNT_QUERY,
+    EXISTS_QUERY,
+    SELECT_BY_TICKER_QUERY,
+    SELECT_PAGE_QUERY,
+    TICKER_SUMMARY_ROW_FACTORY,
+    column_arrays,
+    page_from_rows
+)
+from ..models.ticker_summary import TickerSummary
+from ..database.async_connection_manager import AsyncDatabaseConnectionManager
+from ..exceptions import DatabaseQueryError
+
+
+class AsyncTickerSummaryRepository:
+    """
+    Async repository for ticker summary entities.
+    Covers the read paths a web request fans out to (get, page, count, exists)
+    plus bulk insert, so independent queries can run concurrently on the pool.
+    The synchronous TickerSummaryRepository remains the API for the sync jobs.
+    """
+    
+    def __init__(self, db_manager: AsyncDatabaseConnectionManager):
+        """
+        Initialize the async ticker summary repository.
+        
+        Args:
+            db_manager: Async database connection manager instance
+        """
+        self.db_manager = db_manager
+        self.logger = logging.getLogger(__name__)
+        self.table_name = "ticker_summary"
+    
+    # ============================================================================
+    # CREATE OPERATIONS
+    # ============================================================================
+    
+    async def bulk_insert(self, entities: List[TickerSummary]) -> int:
+        """
+        Insert multiple ticker summary entries in a single transaction.
+        Skips entries that already exist (uses ON CONFLICT DO NOTHING).
+        
+        Args:
+            entities: List of TickerSummary entities to insert
+        
+        Returns:
+            Number of rows successfully inserted
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not entities:
+            return 0
+        
+        try:
+            async with self.db_manager.get_cursor_context() as cursor:
+                rows_inserted = 0
+
+                for start in range(0, len(entities), BULK_CHUNK_SIZE):
+                    chunk = entities[start:start + BULK_CHUNK_SIZE]
+                    await cursor.execute(BULK_INSERT_QUERY, column_arrays(chunk))
+                    rows_inserted += cursor.rowcount
+
+                self.logger.info(f"Successfully bulk inserted {rows_inserted} ticker summaries")
+                return rows_inserted
+
+        except Exception as e:
+            raise DatabaseQueryError("bulk insert ticker summaries", str(e))
+    
+    # ============================================================================
+    # READ OPERATIONS
+    # ============================================================================
+    
+    async def get_by_ticker(self, ticker: str) -> Optional[TickerSummary]:
+        """
+        Retrieve a ticker summary entry by its ticker symbol (primary key).
+        
+        Args:
+            ticker: The ticker symbol to retrieve
+        
+        Returns:
+            TickerSummary if found, None otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(
+                commit=False, row_factory=TICKER_SUMMARY_ROW_FACTORY
+            ) as cursor:
+                await cursor.execute(SELECT_BY_TICKER_QUERY, (ticker.upper(),), prepare=True)
+                return await cursor.fetchone()
+
+        except Exception as e:
+            raise DatabaseQueryError("get ticker summary by ticker", str(e))
+    
+    async def get_page(self, limit: int, offset: int = 0) -> Tuple[List[TickerSummary], int]:
+        """
+        Retrieve one page of ticker summary entries together with the total count.
+        
+        Args:
+            limit: Maximum number of entries to return
+            offset: Number of entries to skip
+        
+        Returns:
+            Tuple of (entries on this page, total number of entries). The total is 0
+            when the page is past the end of the table.
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False, row_factory=dict_row) as cursor:
+                await cursor.execute(SELECT_PAGE_QUERY, (limit, offset), prepare=True)
+                return page_from_rows(await cursor.fetchall())
+
+        except Exception as e:
+            raise DatabaseQueryError("get ticker summary page", str(e))
+    
+    async def count(self) -> int:
+        """
+        Count the total number of ticker summary entries.
+        
+        Returns:
+            Total count of entries
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(COUNT_QUERY, prepare=True)
+                result = await cursor.fetchone()
+                return result[0] if result else 0
+
+        except Exception as e:
+            raise DatabaseQueryError("count ticker summaries", str(e))
+    
+    async def exists(self, ticker: str) -> bool:
+        """
+        Check if a ticker exists in the database.
+        
+        Args:
+            ticker: The ticker symbol to check
+        
+        Returns:
+            True if the ticker exists, False otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        try:
+            async with self.db_manager.get_cursor_context(commit=False) as cursor:
+                await cursor.execute(EXISTS_QUERY, (ticker.upper(),), prepare=True)
+                return await cursor.fetchone() is not None
+
+        except Exception as e:
+            raise DatabaseQueryError("check ticker existence", str(e))
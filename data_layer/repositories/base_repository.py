@@ -2,14 +2,53 @@
 Abstract base repository class.
 """
 
+import copy
 import logging
+import uuid
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TypeVar, Generic, Any, Callable, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from psycopg import sql
+
+from ..cache import Cache
 from ..database.connection_manager import DatabaseConnectionManager
 
 
 T = TypeVar('T')
+R = TypeVar('R')
+
+# Rows sent per bulk statement; keeps multi-row statements well under
+# Postgres' 65535 bind-parameter limit and bounds per-batch memory
+BULK_CHUNK_SIZE = 1000
+
+# Batches at least this large are loaded with COPY through a staging table;
+# below it the temp table setup costs more than the multi-row statements it replaces
+COPY_THRESHOLD = 5000
+
+
+@lru_cache(maxsize=128)
+def _paginated_query(select_query: str, has_limit: bool, has_offset: bool) -> str:
+    """
+    Append LIMIT/OFFSET placeholders to a SELECT statement.
+    Cached, so each (statement, shape) pair is only assembled once.
+    
+    Args:
+        select_query: SELECT statement, with or without a trailing semicolon
+        has_limit: Whether to add a LIMIT placeholder
+        has_offset: Whether to add an OFFSET placeholder
+    
+    Returns:
+        The statement with the requested clauses and a trailing semicolon
+    """
+    query = select_query.rstrip().rstrip(";")
+    if has_limit:
+        query += " LIMIT %s"
+    if has_offset:
+        query += " OFFSET %s"
+    return query + ";"
 
 
 class BaseRepository(ABC, Generic[T]):
@@ -28,6 +67,58 @@ class BaseRepository(ABC, Generic[T]):
         self.db_manager = db_manager
         self.logger = logging.getLogger(__name__)
         self.table_name = ""  # To be set by subclasses
+        self._cache: Optional[Cache[Any, T]] = None  # Lookup cache, set by subclasses that have one
+        # Per thread / asyncio task, so a session never leaks into other callers
+        # sharing this repository instance
+        self._session_cursor: ContextVar[Optional[Any]] = ContextVar(
+            f"{type(self).__name__}_session_cursor", default=None
+        )
+        # Actions to run once the current transaction has ended, see _after_commit
+        self._pending_actions: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+            f"{type(self).__name__}_pending_actions", default=None
+        )
+    
+    @property
+    def _ambient_cursor(self) -> Optional[Any]:
+        """The cursor of the session opened by the current thread or task, if any."""
+        return self._session_cursor.get()
+    
+    # ============================================================================
+    # SESSION MANAGEMENT
+    # ============================================================================
+    
+    @contextmanager
+    def session(self, commit: bool = True) -> Generator[Any, None, None]:
+        """
+        Run a block of repository calls on one pooled connection and cursor.
+        Every method called on this repository inside the block reuses the
+        session cursor instead of checking out its own connection, and the
+        whole block runs as a single transaction.
+        
+        A failed statement aborts the session transaction, so a caller that
+        catches a DatabaseQueryError inside the block should leave the block.
+        A session belongs to the thread (or asyncio task) that opened it; other
+        threads using the same repository instance meanwhile keep checking out
+        their own connections. Nested calls reuse the outer session.
+        
+        Args:
+            commit: Whether to commit the transaction when the block exits cleanly
+        
+        Yields:
+            psycopg.Cursor: The session cursor
+        """
+        ambient_cursor = self._ambient_cursor
+        if ambient_cursor is not None:
+            yield ambient_cursor
+            return
+        
+        with self._deferred_actions():
+            with self.db_manager.get_cursor_context(commit=commit) as cursor:
+                token = self._session_cursor.set(cursor)
+                try:
+                    yield cursor
+                finally:
+                    self._session_cursor.reset(token)
     
     # ============================================================================
     # CREATE OPERATIONS
@@ -170,4 +261,259 @@ class BaseRepository(ABC, Generic[T]):
             DatabaseQueryError: If database operation fails
         """
         pass
-    
\ No newline at end of file
+    
+    # ============================================================================
+    # HELPER METHODS
+    # ============================================================================
+    
+    def _chunks(self, items: Sequence[R], size: int = BULK_CHUNK_SIZE) -> Iterator[Sequence[R]]:
+        """
+        Split a sequence into consecutive chunks for bulk operations.
+        
+        The bulk methods send one statement per chunk and bind each column as a
+        single array (unnest / ANY), so the SQL text is the same for every chunk
+        and batch size, and no per-row placeholders are built.
+        
+        Args:
+            items: Items to split
+            size: Maximum number of items per chunk
+        
+        Yields:
+            Slices of at most size items, in order
+        """
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+    
+    def _copy_to_staging(self,
+                         cursor: Any,
+                         table: str,
+                         columns: Sequence[str],
+                         rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Create the <table>_staging temp table and COPY rows into it.
+        The staging table has only the given columns, with the types they have in
+        table and no constraints, defaults or identity. It is dropped at commit;
+        call _drop_staging to drop it sooner.
+        
+        Args:
+            cursor: Cursor of the transaction that will consume the staged rows
+            table: Table whose column types the staging table copies
+            columns: Columns to stage, in the order of each row's values
+            rows: Iterable of row value tuples to copy
+        
+        Returns:
+            Number of rows copied
+        """
+        staging_table = sql.Identifier(f"{table}_staging")
+        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+        
+        cursor.execute(
+            sql.SQL(
+                "CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA;"
+            ).format(staging=staging_table, columns=column_list, table=sql.Identifier(table))
+        )
+        
+        total_copied = 0
+        copy_query = sql.SQL("COPY {staging} ({columns}) FROM STDIN").format(
+            staging=staging_table, columns=column_list
+        )
+        with cursor.copy(copy_query) as copy:
+            for row in rows:
+                copy.write_row(row)
+                total_copied += 1
+        
+        return total_copied
+    
+    def _drop_staging(self, cursor: Any, table: str) -> None:
+        """
+        Drop the staging table now rather than at commit, so a session can stage again.
+        
+        Args:
+            cursor: Cursor that created the staging table
+            table: Table the staging table was created for
+        """
+        cursor.execute(sql.SQL("DROP TABLE {staging};").format(staging=sql.Identifier(f"{table}_staging")))
+    
+    def _get_cached(self, key: Any) -> Optional[T]:
+        """
+        Look up a cached entity, returning a copy the caller is free to modify.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            A copy of the cached entity, or None if it isn't cached
+        """
+        cached = self._cache.get(key)
+        return copy.copy(cached) if cached is not None else None
+    
+    def _set_cached(self, key: Any, entity: T) -> None:
+        """
+        Cache a copy of an entity, so later changes to the caller's instance
+        don't leak into the cache. Skipped inside a session, where the row
+        may be uncommitted.
+        
+        Args:
+            key: Cache key
+            entity: Entity read from the database
+        """
+        if self._ambient_cursor is None:
+            self._cache.set(key, copy.copy(entity))
+    
+    def _invalidate_cached(self, keys: Iterable[Any]) -> None:
+        """
+        Drop cached lookups for keys being written, once the write has committed.
+        Evicting before the commit would let another caller cache the old row
+        again in the meantime and serve it until the entry expires.
+        
+        Args:
+            keys: Cache keys affected by the write
+        """
+        keys = list(keys)
+        self._after_commit(lambda: self._evict_cached(keys))
+    
+    def _clear_cached(self) -> None:
+        """
+        Drop every cached lookup once the write has committed, for writes
+        whose affected keys aren't known.
+        """
+        self._after_commit(lambda: self._evict_cached(None))
+    
+    def _evict_cached(self, keys: Optional[List[Any]]) -> None:
+        """
+        Drop cached lookups now.
+        
+        Args:
+            keys: Cache keys to drop, or None to drop everything
+        """
+        if self._cache is None:
+            return
+        if keys is None:
+            self._cache.clear()
+            return
+        for key in keys:
+            self._cache.invalidate(key)
+    
+    def _after_commit(self, action: Callable[[], None]) -> None:
+        """
+        Run an action once the current transaction has ended (the session's,
+        if one is active), or now if no transaction is open.
+        
+        Args:
+            action: Callable taking no arguments
+        """
+        pending = self._pending_actions.get()
+        if pending is None:
+            action()
+        else:
+            pending.append(action)
+    
+    @contextmanager
+    def _deferred_actions(self) -> Generator[None, None, None]:
+        """
+        Collect the _after_commit actions of a transaction and run them once
+        it has ended. They also run after a rollback, where they are harmless.
+        """
+        pending: List[Callable[[], None]] = []
+        token = self._pending_actions.set(pending)
+        try:
+            yield
+        finally:
+            self._pending_actions.reset(token)
+            for action in pending:
+                action()
+    
+    def _paginate(self,
+                  select_query: str,
+                  limit: Optional[int],
+                  offset: Optional[int],
+                  params: Sequence[Any] = ()) -> Tuple[str, Tuple[Any, ...]]:
+        """
+        Add optional LIMIT/OFFSET to a SELECT statement and its parameters.
+        
+        Args:
+            select_query: SELECT statement to paginate (a module-level constant,
+                          so the cached SQL for each shape is reused)
+            limit: Maximum number of rows, or None for no LIMIT
+            offset: Number of rows to skip, or None for no OFFSET
+            params: Parameters of select_query itself
+        
+        Returns:
+            Tuple of (query, params)
+        """
+        query = _paginated_query(select_query, limit is not None, offset is not None)
+        extra = tuple(value for value in (limit, offset) if value is not None)
+        return query, tuple(params) + extra
+    
+    @contextmanager
+    def _cursor_context(self,
+                        commit: bool = True,
+                        row_factory: Optional[Any] = None) -> Generator[Any, None, None]:
+        """
+        Get the cursor for a single repository call.
+        Uses the active session cursor if there is one (the session decides
+        when to commit), otherwise checks out a connection for this call only.
+        
+        Args:
+            commit: Whether to commit when no session is active
+            row_factory: psycopg row factory to build result rows with, for this call only
+        
+        Yields:
+            psycopg.Cursor: Database cursor
+        """
+        ambient_cursor = self._ambient_cursor
+        if ambient_cursor is not None:
+            if row_factory is None:
+                yield ambient_cursor
+                return
+            
+            previous_row_factory = ambient_cursor.row_factory
+            ambient_cursor.row_factory = row_factory
+            try:
+                yield ambient_cursor
+            finally:
+                ambient_cursor.row_factory = previous_row_factory
+        else:
+            with self._deferred_actions():
+                with self.db_manager.get_cursor_context(commit=commit, row_factory=row_factory) as cursor:
+                    yield cursor
+    
+    def _stream_rows(self,
+                     query: str,
+                     params: Optional[Sequence[Any]] = None,
+                     chunk_size: int = BULK_CHUNK_SIZE,
+                     row_factory: Optional[Any] = None) -> Iterator[Any]:
+        """
+        Stream the rows of a query through a server-side (named) cursor.
+        Rows are fetched chunk_size at a time, so memory stays flat however
+        large the result is. Uses the session connection if one is active.
+        
+        Args:
+            query: SELECT statement to run
+            params: Query parameters
+            chunk_size: Number of rows fetched per round trip
+            row_factory: psycopg row factory to build rows with (tuples if None)
+        
+        Yields:
+            Database rows
+        """
+        # Unique name so several streams can be open on one session connection
+        cursor_name = f"{self.table_name}_stream_{uuid.uuid4().hex[:8]}"
+        
+        ambient_cursor = self._ambient_cursor
+        if ambient_cursor is not None:
+            with ambient_cursor.connection.cursor(name=cursor_name, row_factory=row_factory) as cursor:
+                cursor.execute(query, params)
+                while rows := cursor.fetchmany(chunk_size):
+                    yield from rows
+            return
+        
+        with self.db_manager.get_connection_context() as conn:
+            try:
+                with conn.cursor(name=cursor_name, row_factory=row_factory) as cursor:
+                    cursor.execute(query, params)
+                    while rows := cursor.fetchmany(chunk_size):
+                        yield from rows
+            finally:
+                # Read-only transaction; end it before the connection goes back to the pool
+                conn.rollback()
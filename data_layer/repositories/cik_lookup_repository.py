@@ -3,16 +3,135 @@ CIK lookup repository for database operations.
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional, Any
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Any
 import psycopg
+from psycopg.rows import args_row
 
-from .base_repository import BaseRepository
+from .base_repository import BULK_CHUNK_SIZE, COPY_THRESHOLD, BaseRepository
+from ..cache import Cache, TTLCache
 from ..models.cik_lookup import CikLookup
 from ..database.connection_manager import DatabaseConnectionManager
 from ..exceptions import DatabaseQueryError
 
 
+# Hot-path statements shared by the sync and async repositories.
+# They are executed with prepare=True so even a fresh pooled connection
+# skips parse/plan from the first call.
+SELECT_BY_CIK_QUERY = """
+SELECT cik, company_name, company_name_search, created_at, last_updated_at
+FROM cik_lookup
+WHERE cik = %s;
+"""
+
+SELECT_MANY_BY_CIK_QUERY = """
+SELECT cik, company_name, company_name_search, created_at, last_updated_at
+FROM cik_lookup
+WHERE cik = ANY(%s);
+"""
+
+SELECT_COMPANY_NAME_BY_CIK_QUERY = "SELECT company_name FROM cik_lookup WHERE cik = %s;"
+
+EXISTS_QUERY = "SELECT EXISTS (SELECT 1 FROM cik_lookup WHERE cik = %s);"
+
+COUNT_QUERY = "SELECT COUNT(*) FROM cik_lookup;"
+
+# Paginated with BaseRepository._paginate, which caches the SQL for each LIMIT/OFFSET shape
+SELECT_ALL_QUERY = """
+SELECT cik, company_name, company_name_search, created_at, last_updated_at
+FROM cik_lookup
+ORDER BY cik
+"""
+
+# Builds CikLookup straight from (cik, company_name, company_name_search, created_at,
+# last_updated_at) rows, positionally, so callers select the columns in that order
+CIK_LOOKUP_ROW_FACTORY = args_row(CikLookup)
+
+# CIK -> company mappings almost never change, so lookups are cached in-process
+CIK_CACHE_MAXSIZE = 100_000
+CIK_CACHE_TTL_SECONDS = 3600
+# Short-lived memory of CIKs known to be absent, so repeated misses skip the database
+MISSING_CIK_CACHE_MAXSIZE = 10_000
+MISSING_CIK_CACHE_TTL_SECONDS = 60
+
+# Longer search terms match on substring only; trigram similarity on long
+# patterns expands to many trigram probes and rarely adds useful fuzzy hits
+SIMILARITY_SEARCH_MAX_LENGTH = 32
+
+
+def _escape_like(value: str) -> str:
+    """
+    Escape LIKE metacharacters so user input is matched literally.
+    
+    Args:
+        value: Raw search text
+    
+    Returns:
+        Text safe to embed in a LIKE pattern using ESCAPE '\\'
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def company_name_search_query(company_name: str, limit: int) -> tuple[str, tuple[Any, ...]]:
+    """
+    Build the ranked company name search shared by the sync and async repositories.
+    Matches names containing the term, or (for terms up to SIMILARITY_SEARCH_MAX_LENGTH
+    characters) names trigram-similar to it, best matches first.
+    
+    Args:
+        company_name: The company name to search for
+        limit: Maximum number of results to return
+    
+    Returns:
+        Tuple of (query, params)
+    """
+    term = company_name.strip().lower()
+    
+    query_parts = ["""
+    SELECT cik, company_name, company_name_search, created_at, last_updated_at
+    FROM cik_lookup
+    WHERE company_name_lower LIKE %s ESCAPE '\\'"""]
+    params: List[Any] = [f"%{_escape_like(term)}%"]
+    
+    if len(term) <= SIMILARITY_SEARCH_MAX_LENGTH:
+        # %% is pg_trgm's similarity operator (threshold pg_trgm.similarity_threshold)
+        query_parts.append(" OR company_name_lower %% %s")
+        params.append(term)
+    
+    query_parts.append(" ORDER BY similarity(company_name_lower, %s) DESC, company_name LIMIT %s")
+    params.extend([term, limit])
+    
+    return "".join(query_parts) + ";", tuple(params)
+
+
+# Columns written by the bulk paths; _ROW_VALUES reads them off an entity in one call
+COLUMNS = ("cik", "company_name", "company_name_search")
+_ROW_VALUES = attrgetter(*COLUMNS)
+
+
+def column_arrays(entities: Sequence[CikLookup]) -> tuple[List[int], List[str], List[Optional[str]]]:
+    """
+    Turn entities into one list per column, for unnest()-based bulk statements.
+    Built in a single pass over the entities.
+    
+    Args:
+        entities: CikLookup entities to send
+    
+    Returns:
+        Tuple of (ciks, company_names, company_name_searches)
+    """
+    ciks: List[int] = []
+    company_names: List[str] = []
+    company_name_searches: List[Optional[str]] = []
+    
+    for entity in entities:
+        ciks.append(entity.cik)
+        company_names.append(entity.company_name)
+        company_name_searches.append(entity.company_name_search)
+    
+    return ciks, company_names, company_name_searches
+
+
 class CikLookupNotFoundError(Exception):
     """Exception raised when a CIK lookup is not found."""
     
@@ -37,16 +156,26 @@ class CikLookupRepository(BaseRepository[CikLookup]):
     Supports searching by CIK (primary key) and company name.
     """
     
-    def __init__(self, db_manager: DatabaseConnectionManager):
+    def __init__(self,
+                 db_manager: DatabaseConnectionManager,
+                 cache: Optional[Cache[int, CikLookup]] = None):
         """
         Initialize the CIK lookup repository.
         
         Args:
             db_manager: Database connection manager instance
+            cache: Cache for get_by_cik results, keyed by CIK. Defaults to a
+                   private in-process TTLCache; pass a shared one to share entries.
         """
         super().__init__(db_manager)
         self.logger = logging.getLogger(__name__)
         self.table_name = "cik_lookup"
+        self._cache: Cache[int, CikLookup] = (
+            cache if cache is not None else TTLCache(CIK_CACHE_MAXSIZE, CIK_CACHE_TTL_SECONDS)
+        )
+        self._missing_cache: TTLCache[int, bool] = TTLCache(
+            MISSING_CIK_CACHE_MAXSIZE, MISSING_CIK_CACHE_TTL_SECONDS
+        )
     
     # ============================================================================
     # CREATE OPERATIONS
@@ -68,26 +197,19 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         """
         cik_lookup = entity
         
-        # Check if CIK already exists
-        if self.get_by_cik(cik_lookup.cik) is not None:
-            raise DuplicateCikError(cik_lookup.cik)
-        
+        # Timestamps come from the column defaults so the database owns the clock
         insert_query = """
-        INSERT INTO cik_lookup (cik, company_name, company_name_search, created_at, last_updated_at)
-        VALUES (%s, %s, %s, %s, %s)
+        INSERT INTO cik_lookup (cik, company_name, company_name_search)
+        VALUES (%s, %s, %s)
         RETURNING created_at, last_updated_at;
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                current_time = datetime.now()
-                
+            with self._cursor_context() as cursor:
                 cursor.execute(insert_query, (
                     cik_lookup.cik,
                     cik_lookup.company_name,
-                    cik_lookup.company_name_search,
-                    current_time,
-                    current_time
+                    cik_lookup.company_name_search
                 ))
                 
                 result = cursor.fetchone()
@@ -96,6 +218,8 @@ class CikLookupRepository(BaseRepository[CikLookup]):
                 cik_lookup.created_at = result[0]
                 cik_lookup.last_updated_at = result[1]
                 
+                self._invalidate_cached([cik_lookup.cik])
+                
                 self.logger.info(f"Created CIK lookup: {cik_lookup.cik} - {cik_lookup.company_name}")
                 return cik_lookup
                 
@@ -104,13 +228,15 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         except Exception as e:
             raise DatabaseQueryError("create CIK lookup", str(e))
     
-    def bulk_insert(self, entities: List[CikLookup]) -> int:
+    def bulk_insert(self, entities: List[CikLookup], set_timestamps: bool = False) -> int:
         """
         Insert multiple CIK lookup entries in a single transaction.
         Skips entries that already exist (uses ON CONFLICT DO NOTHING).
         
         Args:
             entities: List of CikLookup entities to insert
+            set_timestamps: If True, copy the database-assigned created_at and
+                            last_updated_at back onto the entities that were inserted
         
         Returns:
             Number of rows successfully inserted
@@ -121,30 +247,52 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         if not entities:
             return 0
         
-        insert_query = """
-        INSERT INTO cik_lookup (cik, company_name, company_name_search, created_at, last_updated_at)
-        VALUES (%s, %s, %s, %s, %s)
-        ON CONFLICT (cik) DO NOTHING;
-        """
-        
-        current_time = datetime.now()
+        # RETURNING cik tells us which entities were inserted and which were skipped
+        returning = " RETURNING cik, created_at, last_updated_at" if set_timestamps else " RETURNING cik"
+        use_copy = len(entities) >= COPY_THRESHOLD
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                # Prepare data for batch insert
-                data = [
-                    (entity.cik, entity.company_name, entity.company_name_search, current_time, current_time)
-                    for entity in entities
-                ]
-                
-                # Use executemany for efficient batch insert
-                cursor.executemany(insert_query, data)
-                total_inserted = cursor.rowcount
-                
-                # Update entities with timestamps
-                for entity in entities:
-                    entity.created_at = current_time
-                    entity.last_updated_at = current_time
+            with self._cursor_context() as cursor:
+                if use_copy:
+                    # Large batch: COPY into staging, then insert it with one statement
+                    self._copy_to_staging(cursor, "cik_lookup", COLUMNS, map(_ROW_VALUES, entities))
+                    source = "SELECT cik, company_name, company_name_search FROM cik_lookup_staging"
+                    chunk_params: Iterable[Optional[tuple[List[Any], ...]]] = [None]
+                else:
+                    # Small batch: one unnest statement per chunk
+                    source = "SELECT * FROM unnest(%s::integer[], %s::varchar[], %s::varchar[])"
+                    chunk_params = (column_arrays(chunk) for chunk in self._chunks(entities))
+                
+                insert_query = (
+                    "INSERT INTO cik_lookup (cik, company_name, company_name_search) "
+                    + source + " ON CONFLICT (cik) DO NOTHING" + returning + ";"
+                )
+                
+                entities_by_cik = {entity.cik: entity for entity in entities} if set_timestamps else {}
+                inserted_ciks: set[int] = set()
+                
+                for params in chunk_params:
+                    cursor.execute(insert_query, params)
+                    rows = cursor.fetchall()
+                    
+                    # Only rows actually inserted come back from RETURNING
+                    inserted_ciks.update(row[0] for row in rows)
+                    if set_timestamps:
+                        for cik, created_at, last_updated_at in rows:
+                            entity = entities_by_cik[cik]
+                            entity.created_at = created_at
+                            entity.last_updated_at = last_updated_at
+                
+                if use_copy:
+                    self._drop_staging(cursor, "cik_lookup")
+                
+                self._invalidate_cached(inserted_ciks)
+                
+                total_inserted = len(inserted_ciks)
+                skipped_ciks = [entity.cik for entity in entities if entity.cik not in inserted_ciks]
+                if skipped_ciks:
+                    self.logger.info(f"Skipped {len(skipped_ciks)} CIK lookups that already exist")
+                    self.logger.debug(f"Skipped CIKs: {skipped_ciks}")
                 
                 self.logger.info(f"Bulk inserted {total_inserted} new CIK lookups")
                 return total_inserted
@@ -152,6 +300,55 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         except Exception as e:
             raise DatabaseQueryError("bulk insert CIK lookups", str(e))
     
+    def copy_from_iterable(self, entities: Iterable[CikLookup]) -> int:
+        """
+        Load CIK lookup entries with COPY into a staging table, then upsert them.
+        Intended for full refreshes of the SEC CIK master list, where per-row
+        INSERTs dominate the run time. Existing entries whose company name
+        changed are updated; unchanged entries are left alone.
+        
+        Args:
+            entities: Iterable of CikLookup entities to load (streamed, not materialized)
+        
+        Returns:
+            Number of rows inserted or updated
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        # DISTINCT ON keeps a duplicated CIK in the feed from hitting the same row twice
+        upsert_query = """
+        INSERT INTO cik_lookup (cik, company_name, company_name_search)
+        SELECT DISTINCT ON (cik) cik, company_name, company_name_search
+        FROM cik_lookup_staging
+        ORDER BY cik
+        ON CONFLICT (cik) DO UPDATE
+        SET company_name = EXCLUDED.company_name,
+            company_name_search = EXCLUDED.company_name_search
+        WHERE (cik_lookup.company_name, cik_lookup.company_name_search)
+            IS DISTINCT FROM (EXCLUDED.company_name, EXCLUDED.company_name_search);
+        """
+        
+        try:
+            with self._cursor_context() as cursor:
+                total_copied = self._copy_to_staging(cursor, "cik_lookup", COLUMNS, map(_ROW_VALUES, entities))
+                
+                cursor.execute(upsert_query)
+                total_upserted = cursor.rowcount
+                
+                self._drop_staging(cursor, "cik_lookup")
+                
+                # The entities were streamed and are gone, so drop everything cached
+                self._clear_cached()
+                
+                self.logger.info(
+                    f"Copied {total_copied} CIK lookups, inserted or updated {total_upserted}"
+                )
+                return total_upserted
+                
+        except Exception as e:
+            raise DatabaseQueryError("copy CIK lookups", str(e))
+    
     # ============================================================================
     # READ OPERATIONS
     # ============================================================================
@@ -159,6 +356,7 @@ class CikLookupRepository(BaseRepository[CikLookup]):
     def get_by_cik(self, cik: int) -> Optional[CikLookup]:
         """
         Retrieve a CIK lookup entry by its CIK (primary key).
+        Served from the in-process cache when possible.
         
         Args:
             cik: The CIK to retrieve
@@ -169,31 +367,77 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        select_query = """
-        SELECT cik, company_name, company_name_search, created_at, last_updated_at
-        FROM cik_lookup
-        WHERE cik = %s;
-        """
+        cached = self._get_cached(cik)
+        if cached is not None:
+            return cached
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (cik,))
-                result = cursor.fetchone()
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_BY_CIK_QUERY, (cik,), prepare=True)
+                cik_lookup = cursor.fetchone()
                 
-                if result:
-                    return CikLookup(
-                        cik=result[0],
-                        company_name=result[1],
-                        company_name_search=result[2],
-                        created_at=result[3],
-                        last_updated_at=result[4]
-                    )
-                return None
+                if cik_lookup is not None:
+                    self._set_cached(cik, cik_lookup)
+                return cik_lookup
                 
         except Exception as e:
             self.logger.error(f"Error retrieving CIK lookup by CIK {cik}: {e}")
             raise DatabaseQueryError("get CIK lookup by CIK", str(e))
     
+    def get_company_name_by_cik(self, cik: int) -> Optional[str]:
+        """
+        Retrieve only the company name for a CIK.
+        Cheaper than get_by_cik for callers that only need the name: it can be
+        answered by an index-only scan of idx_cik_lookup_cik_company_name (migration 005).
+        
+        Args:
+            cik: The CIK to look up
+        
+        Returns:
+            The company name if found, None otherwise
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        cached = self._cache.get(cik)
+        if cached is not None:
+            return cached.company_name
+        
+        try:
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(SELECT_COMPANY_NAME_BY_CIK_QUERY, (cik,), prepare=True)
+                result = cursor.fetchone()
+                return result[0] if result else None
+                
+        except Exception as e:
+            self.logger.error(f"Error retrieving company name by CIK {cik}: {e}")
+            raise DatabaseQueryError("get company name by CIK", str(e))
+    
+    def get_many_by_cik(self, ciks: List[int]) -> Dict[int, CikLookup]:
+        """
+        Retrieve several CIK lookup entries in one query.
+        
+        Args:
+            ciks: The CIKs to retrieve
+        
+        Returns:
+            Dictionary mapping each found CIK to its CikLookup; missing CIKs are absent
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not ciks:
+            return {}
+        
+        try:
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_MANY_BY_CIK_QUERY, (list(ciks),), prepare=True)
+                return {cik_lookup.cik: cik_lookup for cik_lookup in cursor.fetchall()}
+                
+        except Exception as e:
+            self.logger.error(f"Error retrieving {len(ciks)} CIK lookups by CIK: {e}")
+            raise DatabaseQueryError("get CIK lookups by CIK", str(e))
+    
     def get_by_company_name(self, company_name: str, exact_match: bool = True) -> Optional[CikLookup]:
         """
         Retrieve a CIK lookup entry by company name.
@@ -213,33 +457,23 @@ class CikLookupRepository(BaseRepository[CikLookup]):
             select_query = """
             SELECT cik, company_name, company_name_search, created_at, last_updated_at
             FROM cik_lookup
-            WHERE LOWER(company_name) = LOWER(%s)
+            WHERE company_name_lower = %s
             LIMIT 1;
             """
-            params = (company_name.strip(),)
+            params = (company_name.strip().lower(),)
         else:
             select_query = """
             SELECT cik, company_name, company_name_search, created_at, last_updated_at
             FROM cik_lookup
-            WHERE LOWER(company_name) LIKE LOWER(%s)
+            WHERE company_name_lower LIKE %s ESCAPE '\\'
             LIMIT 1;
             """
-            params = (f"%{company_name.strip()}%",)
+            params = (f"%{_escape_like(company_name.strip().lower())}%",)
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
                 cursor.execute(select_query, params)
-                result = cursor.fetchone()
-                
-                if result:
-                    return CikLookup(
-                        cik=result[0],
-                        company_name=result[1],
-                        company_name_search=result[2],
-                        created_at=result[3],
-                        last_updated_at=result[4]
-                    )
-                return None
+                return cursor.fetchone()
                 
         except Exception as e:
             self.logger.error(f"Error retrieving CIK lookup by company name {company_name}: {e}")
@@ -247,12 +481,39 @@ class CikLookupRepository(BaseRepository[CikLookup]):
     
     def search_by_company_name(self, company_name: str, limit: int = 10) -> List[CikLookup]:
         """
-        Search for CIK lookup entries by company name (partial match).
+        Search for CIK lookup entries by company name (partial or fuzzy match).
+        Results are ranked by trigram similarity to the search term.
         
         Args:
             company_name: The company name to search for
             limit: Maximum number of results to return
         
+        Returns:
+            List of matching CikLookup entries, most similar first
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        select_query, params = company_name_search_query(company_name, limit)
+        
+        try:
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(select_query, params)
+                return cursor.fetchall()
+                
+        except Exception as e:
+            self.logger.error(f"Error searching CIK lookup by company name {company_name}: {e}")
+            raise DatabaseQueryError("search CIK lookup by company name", str(e))
+    
+    def get_by_company_name_prefix(self, prefix: str, limit: int = 10) -> List[CikLookup]:
+        """
+        Retrieve CIK lookup entries whose company name starts with a prefix (case-insensitive).
+        Left-anchored, so it can use the text_pattern_ops index instead of the trigram index.
+        
+        Args:
+            prefix: The start of the company name
+            limit: Maximum number of results to return
+        
         Returns:
             List of matching CikLookup entries
         
@@ -262,30 +523,19 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         select_query = """
         SELECT cik, company_name, company_name_search, created_at, last_updated_at
         FROM cik_lookup
-        WHERE LOWER(company_name) LIKE LOWER(%s)
+        WHERE company_name_lower LIKE %s ESCAPE '\\'
         ORDER BY company_name
         LIMIT %s;
         """
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (f"%{company_name.strip()}%", limit))
-                results = cursor.fetchall()
-                
-                return [
-                    CikLookup(
-                        cik=row[0],
-                        company_name=row[1],
-                        company_name_search=row[2],
-                        created_at=row[3],
-                        last_updated_at=row[4]
-                    )
-                    for row in results
-                ]
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(select_query, (f"{_escape_like(prefix.strip().lower())}%", limit))
+                return cursor.fetchall()
                 
         except Exception as e:
-            self.logger.error(f"Error searching CIK lookup by company name {company_name}: {e}")
-            raise DatabaseQueryError("search CIK lookup by company name", str(e))
+            self.logger.error(f"Error retrieving CIK lookup by company name prefix {prefix}: {e}")
+            raise DatabaseQueryError("get CIK lookup by company name prefix", str(e))
     
     def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[CikLookup]:
         """
@@ -301,42 +551,45 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        # Use parameterized query parts for safe SQL construction
-        query_parts = ["""
-        SELECT cik, company_name, company_name_search, created_at, last_updated_at
-        FROM cik_lookup
-        ORDER BY cik"""]
+        query, params = self._paginate(SELECT_ALL_QUERY, limit, offset)
         
-        params: List[int] = []
+        try:
+            with self._cursor_context(commit=False, row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+                
+        except Exception as e:
+            self.logger.error(f"Error retrieving all CIK lookups: {e}")
+            raise DatabaseQueryError("get all CIK lookups", str(e))
+    
+    def iter_all(self, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[CikLookup]:
+        """
+        Iterate over all CIK lookup entries without loading the table into memory.
+        Prefer this over get_all() for full-table scans.
+        
+        Args:
+            chunk_size: Number of rows fetched from the server per round trip
         
-        if limit is not None:
-            query_parts.append(" LIMIT %s")
-            params.append(limit)
-        if offset is not None:
-            query_parts.append(" OFFSET %s")
-            params.append(offset)
+        Yields:
+            CikLookup entries ordered by CIK
         
-        query = "".join(query_parts) + ";"
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        select_query = """
+        SELECT cik, company_name, company_name_search, created_at, last_updated_at
+        FROM cik_lookup
+        ORDER BY cik;
+        """
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, tuple(params) if params else None)
-                results = cursor.fetchall()
-                
-                return [
-                    CikLookup(
-                        cik=row[0],
-                        company_name=row[1],
-                        company_name_search=row[2],
-                        created_at=row[3],
-                        last_updated_at=row[4]
-                    )
-                    for row in results
-                ]
+            yield from self._stream_rows(
+                select_query, chunk_size=chunk_size, row_factory=CIK_LOOKUP_ROW_FACTORY
+            )
                 
         except Exception as e:
-            self.logger.error(f"Error retrieving all CIK lookups: {e}")
-            raise DatabaseQueryError("get all CIK lookups", str(e))
+            self.logger.error(f"Error iterating CIK lookups: {e}")
+            raise DatabaseQueryError("iterate CIK lookups", str(e))
     
     def count(self) -> int:
         """
@@ -348,11 +601,9 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        count_query = "SELECT COUNT(*) FROM cik_lookup;"
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(count_query)
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(COUNT_QUERY, prepare=True)
                 result = cursor.fetchone()
                 return result[0] if result else 0
                 
@@ -373,12 +624,20 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query = "SELECT 1 FROM cik_lookup WHERE cik = %s LIMIT 1;"
+        if cik in self._cache:
+            return True
+        if cik in self._missing_cache:
+            return False
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, (cik,))
-                return cursor.fetchone() is not None
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(EXISTS_QUERY, (cik,), prepare=True)
+                result = cursor.fetchone()
+                found = bool(result[0]) if result else False
+                
+                if not found and self._ambient_cursor is None:
+                    self._missing_cache.set(cik, True)
+                return found
                 
         except Exception as e:
             self.logger.error(f"Error checking if CIK {cik} exists: {e}")
@@ -405,38 +664,38 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         """
         cik_lookup = entity
         
-        # Check if the CIK exists
-        existing = self.get_by_cik(cik_lookup.cik)
-        if existing is None:
-            raise CikLookupNotFoundError("cik", cik_lookup.cik)
-        
         update_query = """
         UPDATE cik_lookup
-        SET company_name = %s, company_name_search = %s, last_updated_at = %s
+        SET company_name = %s, company_name_search = %s
         WHERE cik = %s
         RETURNING created_at, last_updated_at;
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                current_time = datetime.now()
-                
+            with self._cursor_context() as cursor:
                 cursor.execute(update_query, (
                     cik_lookup.company_name,
                     cik_lookup.company_name_search,
-                    current_time,
                     cik_lookup.cik
                 ))
                 
                 result = cursor.fetchone()
                 
+                # No row back from RETURNING means the CIK doesn't exist
+                if result is None:
+                    raise CikLookupNotFoundError("cik", cik_lookup.cik)
+                
                 # Update the object with database values
                 cik_lookup.created_at = result[0]
                 cik_lookup.last_updated_at = result[1]
                 
+                self._invalidate_cached([cik_lookup.cik])
+                
                 self.logger.info(f"Updated CIK lookup: {cik_lookup.cik}")
                 return cik_lookup
                 
+        except CikLookupNotFoundError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("update CIK lookup", str(e))
     
@@ -455,22 +714,40 @@ class CikLookupRepository(BaseRepository[CikLookup]):
             CikLookupNotFoundError: If CIK doesn't exist
             DatabaseQueryError: If database operation fails
         """
-        # Get existing entry
-        existing = self.get_by_cik(cik)
-        if existing is None:
-            raise CikLookupNotFoundError("cik", cik)
+        update_query = """
+        UPDATE cik_lookup
+        SET company_name = %s
+        WHERE cik = %s
+        RETURNING cik, company_name, company_name_search, created_at, last_updated_at;
+        """
         
-        # Update the company name
-        existing.company_name = company_name
-        return self.update(existing)
+        try:
+            with self._cursor_context(row_factory=CIK_LOOKUP_ROW_FACTORY) as cursor:
+                cursor.execute(update_query, (company_name.strip(), cik))
+                cik_lookup = cursor.fetchone()
+                
+                if cik_lookup is None:
+                    raise CikLookupNotFoundError("cik", cik)
+                
+                self._invalidate_cached([cik])
+                
+                self.logger.info(f"Updated company name for CIK lookup: {cik}")
+                return cik_lookup
+                
+        except CikLookupNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseQueryError("update CIK lookup company name", str(e))
     
-    def bulk_update(self, entities: List[CikLookup]) -> int:
+    def bulk_update(self, entities: List[CikLookup], set_timestamps: bool = False) -> int:
         """
         Update multiple existing CIK lookup entries in a single transaction.
         Only updates entries that already exist in the database.
         
         Args:
             entities: List of CikLookup entities to update
+            set_timestamps: If True, copy the database-assigned last_updated_at
+                            back onto the entities that were updated
         
         Returns:
             Number of rows successfully updated
@@ -481,29 +758,47 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         if not entities:
             return 0
         
-        update_query = """
-        UPDATE cik_lookup
-        SET company_name = %s, company_name_search = %s, last_updated_at = %s
-        WHERE cik = %s;
-        """
-        
-        current_time = datetime.now()
+        returning = " RETURNING cik_lookup.cik, cik_lookup.last_updated_at" if set_timestamps else ""
+        use_copy = len(entities) >= COPY_THRESHOLD
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                # Prepare data for batch update
-                data = [
-                    (entity.company_name, entity.company_name_search, current_time, entity.cik)
-                    for entity in entities
-                ]
+            with self._cursor_context() as cursor:
+                if use_copy:
+                    # Large batch: COPY into staging, then update from it with one statement
+                    self._copy_to_staging(cursor, "cik_lookup", COLUMNS, map(_ROW_VALUES, entities))
+                    source = "cik_lookup_staging AS v"
+                    chunk_params: Iterable[Optional[tuple[List[Any], ...]]] = [None]
+                else:
+                    # Small batch: one unnest statement per chunk
+                    source = (
+                        "unnest(%s::integer[], %s::varchar[], %s::varchar[]) "
+                        "AS v (cik, company_name, company_name_search)"
+                    )
+                    chunk_params = (column_arrays(chunk) for chunk in self._chunks(entities))
+                
+                update_query = (
+                    "UPDATE cik_lookup SET company_name = v.company_name, "
+                    "company_name_search = v.company_name_search FROM "
+                    + source + " WHERE cik_lookup.cik = v.cik" + returning + ";"
+                )
                 
-                # Use executemany for efficient batch update
-                cursor.executemany(update_query, data)
-                total_updated = cursor.rowcount
+                entities_by_cik = {entity.cik: entity for entity in entities} if set_timestamps else {}
+                total_updated = 0
                 
-                # Update entities with new timestamp
-                for entity in entities:
-                    entity.last_updated_at = current_time
+                for params in chunk_params:
+                    cursor.execute(update_query, params)
+                    
+                    if set_timestamps:
+                        # Only rows actually updated come back from RETURNING
+                        for cik, last_updated_at in cursor.fetchall():
+                            entities_by_cik[cik].last_updated_at = last_updated_at
+                    
+                    total_updated += cursor.rowcount
+                
+                if use_copy:
+                    self._drop_staging(cursor, "cik_lookup")
+                
+                self._invalidate_cached(entity.cik for entity in entities)
                 
                 self.logger.info(f"Bulk updated {total_updated} CIK lookups")
                 return total_updated
@@ -535,11 +830,12 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(delete_query, (cik,))
                 deleted = cursor.rowcount > 0
                 
                 if deleted:
+                    self._invalidate_cached([cik])
                     self.logger.info(f"Deleted CIK lookup: {cik}")
                 
                 return deleted
@@ -563,22 +859,42 @@ class CikLookupRepository(BaseRepository[CikLookup]):
         if not entity_ids:
             return 0
         
+        # One statement per chunk with the CIKs sent as a single array parameter
         delete_query = """
         DELETE FROM cik_lookup
-        WHERE cik = %s;
+        WHERE cik = ANY(%s::integer[]);
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                # Prepare data for batch delete - executemany expects tuples
-                data = [(cik,) for cik in entity_ids]
+            with self._cursor_context() as cursor:
+                total_deleted = 0
                 
-                # Use executemany for efficient batch delete
-                cursor.executemany(delete_query, data)
-                total_deleted = cursor.rowcount
+                for chunk in self._chunks(entity_ids):
+                    cursor.execute(delete_query, (list(chunk),))
+                    total_deleted += cursor.rowcount
+                
+                self._invalidate_cached(entity_ids)
                 
                 self.logger.info(f"Bulk deleted {total_deleted} CIK lookups")
                 return total_deleted
                 
         except Exception as e:
             raise DatabaseQueryError("bulk delete CIK lookups", str(e))
+    
+    # ============================================================================
+    # HELPER METHODS
+    # ============================================================================
+    
+    def _evict_cached(self, ciks: Optional[List[int]]) -> None:
+        """
+        Drop cached lookups and cached misses now.
+        
+        Args:
+            ciks: CIKs to drop, or None to drop everything
+        """
+        super()._evict_cached(ciks)
+        if ciks is None:
+            self._missing_cache.clear()
+            return
+        for cik in ciks:
+            self._missing_cache.invalidate(cik)
@@ -3,15 +3,108 @@ Ticker directory repository for database operations.
 """
 
 import logging
-import psycopg
-from typing import List, Optional, Any
+from psycopg.rows import class_row
+from typing import Iterable, Iterator, List, Optional, Sequence, Any
 
-from .base_repository import BaseRepository
+from .base_repository import BULK_CHUNK_SIZE, COPY_THRESHOLD, BaseRepository
+from ..cache import Cache, TTLCache
 from ..models.ticker_directory import TickerDirectory, TickerDirectoryStatus
 from ..database.connection_manager import DatabaseConnectionManager
 from ..exceptions import DatabaseQueryError
 
 
+# Single-row statements, executed with prepare=True so each pooled
+# connection parses and plans them once.
+# Note: id is GENERATED ALWAYS AS IDENTITY, so it is never inserted
+INSERT_QUERY = """
+INSERT INTO ticker_directory (ticker, cik, status)
+VALUES (%s, %s, %s)
+ON CONFLICT (cik, ticker) DO NOTHING
+RETURNING cik, ticker, created_at, last_updated_at, status, id;
+"""
+
+SELECT_BY_TICKER_QUERY = """
+SELECT cik, ticker, created_at, last_updated_at, status, id
+FROM ticker_directory
+WHERE ticker = %s;
+"""
+
+SELECT_BY_CIK_QUERY = """
+SELECT cik, ticker, created_at, last_updated_at, status, id
+FROM ticker_directory
+WHERE cik = %s;
+"""
+
+COUNT_QUERY = "SELECT COUNT(*) FROM ticker_directory;"
+
+# Paginated with BaseRepository._paginate, which caches the SQL for each LIMIT/OFFSET shape
+SELECT_ALL_QUERY = """
+SELECT cik, ticker, created_at, last_updated_at, status, id
+FROM ticker_directory
+ORDER BY id
+"""
+
+SELECT_BY_STATUS_QUERY = """
+SELECT cik, ticker, created_at, last_updated_at, status, id
+FROM ticker_directory
+WHERE status = %s
+ORDER BY id
+"""
+
+COUNT_BY_STATUS_QUERY = "SELECT COUNT(*) FROM ticker_directory WHERE status = %s;"
+
+EXISTS_QUERY = "SELECT 1 FROM ticker_directory WHERE ticker = %s LIMIT 1;"
+
+UPDATE_QUERY = """
+UPDATE ticker_directory
+SET cik = %s, status = %s
+WHERE ticker = %s
+RETURNING cik, ticker, created_at, last_updated_at, status, id;
+"""
+
+UPDATE_STATUS_QUERY = """
+UPDATE ticker_directory
+SET status = %s
+WHERE ticker = %s
+RETURNING cik, ticker, created_at, last_updated_at, status, id;
+"""
+
+DELETE_QUERY = "DELETE FROM ticker_directory WHERE id = %s;"
+
+# Entries only change during the directory sync, so ticker lookups are cached briefly
+TICKER_DIRECTORY_CACHE_MAXSIZE = 16_384
+TICKER_DIRECTORY_CACHE_TTL_SECONDS = 60
+
+
+# Builds TickerDirectory straight from result rows, matching columns to fields by name;
+# the model turns the status label into a TickerDirectoryStatus
+TICKER_DIRECTORY_ROW_FACTORY = class_row(TickerDirectory)
+
+
+# Columns written by the bulk paths
+COLUMNS = ("ticker", "cik", "status")
+
+
+def column_arrays(entities: Sequence[TickerDirectory]) -> tuple[List[str], List[int], List[str]]:
+    """
+    Turn entities into one list per column, for unnest()-based bulk statements.
+    
+    Args:
+        entities: TickerDirectory entities to send
+    
+    Returns:
+        Tuple of (tickers, ciks, status labels)
+    """
+    tickers: List[str] = []
+    ciks: List[int] = []
+    statuses: List[str] = []
+    for td in entities:
+        tickers.append(td.ticker)
+        ciks.append(td.cik)
+        statuses.append(td.status.value)
+    return tickers, ciks, statuses
+
+
 class TickerDirectoryNotFoundError(Exception):
     """Exception raised when a ticker directory entry is not found."""
     
@@ -34,18 +127,28 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
     Repository for ticker directory entities with full CRUD operations.
     Organized by: CREATE, READ, UPDATE, DELETE operations.
     Supports searching by ID (primary key), ticker, and CIK with filtering by status.
+    
+    Single-row statements run with prepare=True, so each pooled connection
+    parses and plans them once instead of on every call.
     """
     
-    def __init__(self, db_manager: DatabaseConnectionManager):
+    def __init__(self,
+                 db_manager: DatabaseConnectionManager,
+                 cache: Optional[Cache[str, TickerDirectory]] = None):
         """
         Initialize the ticker directory repository.
         
         Args:
             db_manager: Database connection manager instance
+            cache: Cache for get_by_ticker results, keyed by ticker. Defaults to a
+                   private in-process TTLCache; pass a shared one to share entries.
         """
         super().__init__(db_manager)
         self.logger = logging.getLogger(__name__)
         self.table_name = "ticker_directory"
+        self._cache: Cache[str, TickerDirectory] = cache if cache is not None else TTLCache(
+            TICKER_DIRECTORY_CACHE_MAXSIZE, TICKER_DIRECTORY_CACHE_TTL_SECONDS
+        )
     
     # ============================================================================
     # CREATE OPERATIONS
@@ -66,41 +169,38 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
             DuplicateTickerDirectoryError: If ticker already exists
             DatabaseQueryError: If database operation fails
         """
-        # Note: id is GENERATED ALWAYS AS IDENTITY, so we don't insert it
-        insert_query = """
-        INSERT INTO ticker_directory (ticker, cik, status)
-        VALUES (%s, %s, %s)
-        RETURNING cik, ticker, created_at, last_updated_at, status, id;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context(row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
                 cursor.execute(
-                    insert_query,
+                    INSERT_QUERY,
                     (
                         entity.ticker,
                         entity.cik,
                         entity.status.value
-                    )
+                    ),
+                    prepare=True
                 )
-                row = cursor.fetchone()
+                created_entity = cursor.fetchone()
                 
-                if row is None:
-                    raise DatabaseQueryError("insert ticker directory", "No row returned after insert")
+                # ON CONFLICT DO NOTHING returns no row for an existing (cik, ticker) pair
+                if created_entity is None:
+                    raise DuplicateTickerDirectoryError(entity.ticker)
                 
-                created_entity = self._row_to_entity(row)
+                self._invalidate_cached([created_entity.ticker])
                 self.logger.info(f"Successfully inserted ticker directory: ticker {created_entity.ticker}, ID {created_entity.id}")
                 return created_entity
 
-        except psycopg.errors.UniqueViolation:
-            raise DuplicateTickerDirectoryError(entity.ticker)
+        except DuplicateTickerDirectoryError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("insert ticker directory", str(e))
     
     def bulk_insert(self, entities: List[TickerDirectory]) -> int:
         """
         Insert multiple ticker directory entries in a single transaction.
-        Skips entries that already exist (uses ON CONFLICT DO NOTHING on ticker).
+        Skips entries that already exist (uses ON CONFLICT DO NOTHING on cik and ticker).
+        The generated id and timestamps of each inserted row are copied back onto
+        its entity, so callers don't need to read the rows again.
         
         Args:
             entities: List of TickerDirectory entities to insert
@@ -113,24 +213,48 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         """
         if not entities:
             return 0
-        insert_query = """
-        INSERT INTO ticker_directory (ticker, cik, status)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (cik, ticker) DO NOTHING;
-        """
+        
+        use_copy = len(entities) >= COPY_THRESHOLD
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        td.ticker,
-                        td.cik,
-                        td.status.value
+            with self._cursor_context() as cursor:
+                if use_copy:
+                    # Large batch: COPY into staging, then insert it with one statement
+                    self._copy_to_staging(
+                        cursor, "ticker_directory", COLUMNS,
+                        ((td.ticker, td.cik, td.status.value) for td in entities)
                     )
-                    for td in entities
-                ]
-                cursor.executemany(insert_query, data)
-                rows_inserted = cursor.rowcount
+                    source = "SELECT ticker, cik, status FROM ticker_directory_staging"
+                    chunk_params: Iterable[Optional[tuple[List[Any], ...]]] = [None]
+                else:
+                    # Small batch: one unnest statement per chunk
+                    source = "SELECT * FROM unnest(%s::varchar[], %s::integer[], %s::ticker_directory_status[])"
+                    chunk_params = (column_arrays(chunk) for chunk in self._chunks(entities))
+                
+                # Only rows actually inserted come back from RETURNING
+                insert_query = (
+                    "INSERT INTO ticker_directory (ticker, cik, status) "
+                    + source + " ON CONFLICT (cik, ticker) DO NOTHING"
+                    + " RETURNING cik, ticker, id, created_at, last_updated_at;"
+                )
+                
+                entities_by_key = {(td.cik, td.ticker): td for td in entities}
+                rows_inserted = 0
+                
+                for params in chunk_params:
+                    cursor.execute(insert_query, params)
+                    
+                    for cik, ticker, entry_id, created_at, last_updated_at in cursor.fetchall():
+                        entity = entities_by_key[(cik, ticker)]
+                        entity.id = entry_id
+                        entity.created_at = created_at
+                        entity.last_updated_at = last_updated_at
+                        rows_inserted += 1
+                
+                if use_copy:
+                    self._drop_staging(cursor, "ticker_directory")
+                
+                self._invalidate_cached(td.ticker for td in entities)
                 self.logger.info(f"Successfully bulk inserted {rows_inserted} ticker directory entries")
                 return rows_inserted
 
@@ -144,6 +268,7 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
     def get_by_ticker(self, ticker: str) -> Optional[TickerDirectory]:
         """
         Retrieve a ticker directory entry by its ticker symbol.
+        Served from the in-process cache when possible.
         
         Args:
             ticker: The ticker symbol to retrieve
@@ -154,21 +279,19 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        select_query = """
-        SELECT cik, ticker, created_at, last_updated_at, status, id
-        FROM ticker_directory
-        WHERE ticker = %s;
-        """
+        ticker = ticker.upper()
+        cached = self._get_cached(ticker)
+        if cached is not None:
+            return cached
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (ticker.upper(),))
-                row = cursor.fetchone()
-
-                if row is None:
-                    return None
-
-                return self._row_to_entity(row)
+            with self._cursor_context(commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_BY_TICKER_QUERY, (ticker,), prepare=True)
+                ticker_directory = cursor.fetchone()
+                
+                if ticker_directory is not None:
+                    self._set_cached(ticker, ticker_directory)
+                return ticker_directory
 
         except Exception as e:
             raise DatabaseQueryError("get ticker directory by ticker", str(e))
@@ -186,21 +309,10 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        select_query = """
-        SELECT cik, ticker, created_at, last_updated_at, status, id
-        FROM ticker_directory
-        WHERE cik = %s;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (cik,))
-                row = cursor.fetchone()
-
-                if row is None:
-                    return None
-
-                return self._row_to_entity(row)
+            with self._cursor_context(commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_BY_CIK_QUERY, (cik,), prepare=True)
+                return cursor.fetchone()
 
         except Exception as e:
             raise DatabaseQueryError("get ticker directory by CIK", str(e))
@@ -228,11 +340,9 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         """
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
+            with self._cursor_context(commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
                 cursor.execute(select_query, (ciks,))
-                rows = cursor.fetchall()
-                
-                return [self._row_to_entity(row) for row in rows]
+                return cursor.fetchall()
 
         except Exception as e:
             raise DatabaseQueryError("get ticker directory by CIKs", str(e))
@@ -254,29 +364,12 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query_parts = ["""
-        SELECT cik, ticker, created_at, last_updated_at, status, id
-        FROM ticker_directory
-        WHERE status = %s
-        ORDER BY id"""]
-        
-        params: List[Any] = [status.value]
-        
-        if limit is not None:
-            query_parts.append(" LIMIT %s")
-            params.append(limit)
-        if offset is not None:
-            query_parts.append(" OFFSET %s")
-            params.append(offset)
-        
-        query = "".join(query_parts) + ";"
+        query, params = self._paginate(SELECT_BY_STATUS_QUERY, limit, offset, (status.value,))
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, params)  # type: ignore[arg-type]
-                rows = cursor.fetchall()
-
-                return [self._row_to_entity(row) for row in rows]
+            with self._cursor_context(commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
 
         except Exception as e:
             raise DatabaseQueryError("get ticker directory by status", str(e))
@@ -295,31 +388,43 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query_parts = ["""
-        SELECT cik, ticker, created_at, last_updated_at, status, id
-        FROM ticker_directory
-        ORDER BY id"""]
+        query, params = self._paginate(SELECT_ALL_QUERY, limit, offset)
         
-        params: List[int] = []
+        try:
+            with self._cursor_context(commit=False, row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DatabaseQueryError("get all ticker directory entries", str(e))
+    
+    def iter_all(self, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[TickerDirectory]:
+        """
+        Iterate over all ticker directory entries without loading the table into memory.
+        Prefer this over get_all() for full-table scans.
+        
+        Args:
+            chunk_size: Number of rows fetched from the server per round trip
         
-        if limit is not None:
-            query_parts.append(" LIMIT %s")
-            params.append(limit)
-        if offset is not None:
-            query_parts.append(" OFFSET %s")
-            params.append(offset)
+        Yields:
+            TickerDirectory entries ordered by ID
         
-        query = "".join(query_parts) + ";"
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        select_query = """
+        SELECT cik, ticker, created_at, last_updated_at, status, id
+        FROM ticker_directory
+        ORDER BY id;
+        """
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, params)  # type: ignore[arg-type]
-                rows = cursor.fetchall()
-
-                return [self._row_to_entity(row) for row in rows]
+            yield from self._stream_rows(
+                select_query, chunk_size=chunk_size, row_factory=TICKER_DIRECTORY_ROW_FACTORY
+            )
 
         except Exception as e:
-            raise DatabaseQueryError("get all ticker directory entries", str(e))
+            raise DatabaseQueryError("iterate ticker directory entries", str(e))
     
     def count(self) -> int:
         """
@@ -331,11 +436,9 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        count_query = "SELECT COUNT(*) FROM ticker_directory;"
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(count_query)
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(COUNT_QUERY, prepare=True)
                 result = cursor.fetchone()
                 return result[0] if result else 0
 
@@ -355,11 +458,9 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        count_query = "SELECT COUNT(*) FROM ticker_directory WHERE status = %s;"
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(count_query, (status.value,))
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(COUNT_BY_STATUS_QUERY, (status.value,), prepare=True)
                 result = cursor.fetchone()
                 return result[0] if result else 0
 
@@ -379,11 +480,12 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query = "SELECT 1 FROM ticker_directory WHERE ticker = %s LIMIT 1;"
+        if ticker.upper() in self._cache:
+            return True
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, (ticker.upper(),))
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(EXISTS_QUERY, (ticker.upper(),), prepare=True)
                 return cursor.fetchone() is not None
 
         except Exception as e:
@@ -407,37 +509,29 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
             TickerDirectoryNotFoundError: If ticker doesn't exist
             DatabaseQueryError: If database operation fails
         """
-        # Check if the entry exists
-        existing = self.get_by_ticker(entity.ticker)
-        if existing is None:
-            raise TickerDirectoryNotFoundError("ticker", entity.ticker)
-        
-        update_query = """
-        UPDATE ticker_directory
-        SET cik = %s, status = %s, last_updated_at = CURRENT_TIMESTAMP
-        WHERE ticker = %s
-        RETURNING cik, ticker, created_at, last_updated_at, status, id;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context(row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
                 cursor.execute(
-                    update_query,
+                    UPDATE_QUERY,
                     (
                         entity.cik,
                         entity.status.value,
                         entity.ticker
-                    )
+                    ),
+                    prepare=True
                 )
-                row = cursor.fetchone()
+                updated_entity = cursor.fetchone()
                 
-                if row is None:
-                    raise DatabaseQueryError("update ticker directory", "No row returned after update")
+                # No row back from RETURNING means the ticker doesn't exist
+                if updated_entity is None:
+                    raise TickerDirectoryNotFoundError("ticker", entity.ticker)
                 
-                updated_entity = self._row_to_entity(row)
+                self._invalidate_cached([updated_entity.ticker])
                 self.logger.info(f"Successfully updated ticker directory: ticker {entity.ticker}")
                 return updated_entity
 
+        except TickerDirectoryNotFoundError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("update ticker directory", str(e))
     
@@ -459,22 +553,20 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         
         update_query = """
         UPDATE ticker_directory
-        SET cik = %s, status = %s, last_updated_at = CURRENT_TIMESTAMP
-        WHERE ticker = %s;
+        SET cik = v.cik, status = v.status
+        FROM unnest(%s::varchar[], %s::integer[], %s::ticker_directory_status[]) AS v (ticker, cik, status)
+        WHERE ticker_directory.ticker = v.ticker;
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        td.cik,
-                        td.status.value,
-                        td.ticker
-                    )
-                    for td in entities
-                ]
-                cursor.executemany(update_query, data)
-                rows_updated = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_updated = 0
+                
+                for chunk in self._chunks(entities):
+                    cursor.execute(update_query, column_arrays(chunk))
+                    rows_updated += cursor.rowcount
+                
+                self._invalidate_cached(td.ticker for td in entities)
                 self.logger.info(f"Successfully bulk updated {rows_updated} ticker directory entries")
                 return rows_updated
 
@@ -496,30 +588,21 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
             TickerDirectoryNotFoundError: If ticker doesn't exist
             DatabaseQueryError: If database operation fails
         """
-        # Check if the entry exists
-        existing = self.get_by_ticker(ticker)
-        if existing is None:
-            raise TickerDirectoryNotFoundError("ticker", ticker)
-        
-        update_query = """
-        UPDATE ticker_directory
-        SET status = %s, last_updated_at = CURRENT_TIMESTAMP
-        WHERE ticker = %s
-        RETURNING cik, ticker, created_at, last_updated_at, status, id;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(update_query, (status.value, ticker.upper()))
-                row = cursor.fetchone()
+            with self._cursor_context(row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                cursor.execute(UPDATE_STATUS_QUERY, (status.value, ticker.upper()), prepare=True)
+                updated_entity = cursor.fetchone()
                 
-                if row is None:
-                    raise DatabaseQueryError("update ticker directory status", "No row returned after update")
+                # No row back from RETURNING means the ticker doesn't exist
+                if updated_entity is None:
+                    raise TickerDirectoryNotFoundError("ticker", ticker)
                 
-                updated_entity = self._row_to_entity(row)
+                self._invalidate_cached([updated_entity.ticker])
                 self.logger.info(f"Successfully updated status for ticker {ticker} to {status.value}")
                 return updated_entity
 
+        except TickerDirectoryNotFoundError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("update ticker directory status", str(e))
     
@@ -543,22 +626,68 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         # Normalize tickers to uppercase
         normalized_tickers = [ticker.upper() for ticker in tickers]
         
+        # Chunked so a very large ticker list doesn't become one huge array parameter
         update_query = """
         UPDATE ticker_directory
-        SET status = %s, last_updated_at = CURRENT_TIMESTAMP
-        WHERE ticker = ANY(%s);
+        SET status = %s
+        WHERE ticker = ANY(%s::varchar[]);
         """
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(update_query, (status.value, normalized_tickers))
-                rows_updated = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_updated = 0
+                for chunk in self._chunks(normalized_tickers):
+                    cursor.execute(update_query, (status.value, chunk))
+                    rows_updated += cursor.rowcount
+                self._invalidate_cached(normalized_tickers)
                 self.logger.info(f"Successfully bulk updated {rows_updated} entries to status {status.value}")
                 return rows_updated
 
         except Exception as e:
             raise DatabaseQueryError("bulk update ticker directory status", str(e))
     
+    def bulk_update_status_returning(self, tickers: List[str], status: TickerDirectoryStatus) -> List[TickerDirectory]:
+        """
+        Update the status of multiple ticker directory entries and return the updated rows.
+        Saves reading the entries back afterwards when the caller needs their new state.
+        
+        Args:
+            tickers: List of tickers to update
+            status: The new status to set for all tickers
+        
+        Returns:
+            List of updated TickerDirectory entries (tickers not found are absent)
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not tickers:
+            return []
+        
+        # Normalize tickers to uppercase
+        normalized_tickers = [ticker.upper() for ticker in tickers]
+        
+        # Chunked so a very large ticker list doesn't become one huge array parameter
+        update_query = """
+        UPDATE ticker_directory
+        SET status = %s
+        WHERE ticker = ANY(%s::varchar[])
+        RETURNING cik, ticker, created_at, last_updated_at, status, id;
+        """
+        
+        try:
+            with self._cursor_context(row_factory=TICKER_DIRECTORY_ROW_FACTORY) as cursor:
+                updated_entities: List[TickerDirectory] = []
+                for chunk in self._chunks(normalized_tickers):
+                    cursor.execute(update_query, (status.value, chunk))
+                    updated_entities.extend(cursor.fetchall())
+                self._invalidate_cached(normalized_tickers)
+                self.logger.info(f"Successfully bulk updated {len(updated_entities)} entries to status {status.value}")
+                return updated_entities
+
+        except Exception as e:
+            raise DatabaseQueryError("bulk update ticker directory status", str(e))
+    
     # ============================================================================
     # DELETE OPERATIONS
     # ============================================================================
@@ -576,14 +705,14 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        delete_query = "DELETE FROM ticker_directory WHERE id = %s;"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(delete_query, (entity_id,))
+            with self._cursor_context() as cursor:
+                cursor.execute(DELETE_QUERY, (entity_id,), prepare=True)
                 deleted = cursor.rowcount > 0
                 
                 if deleted:
+                    # Deleted by id, so the ticker isn't known here; drop everything cached
+                    self._clear_cached()
                     self.logger.info(f"Successfully deleted ticker directory entry: ID {entity_id}")
                 else:
                     self.logger.warning(f"No ticker directory entry found to delete: ID {entity_id}")
@@ -613,9 +742,10 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         delete_query = "DELETE FROM ticker_directory WHERE id = ANY(%s);"
         
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(delete_query, (entity_ids,))
                 rows_deleted = cursor.rowcount
+                self._clear_cached()
                 self.logger.info(f"Successfully bulk deleted {rows_deleted} ticker directory entries")
                 return rows_deleted
 
@@ -638,56 +768,15 @@ class TickerDirectoryRepository(BaseRepository[TickerDirectory]):
         if not ciks:
             return 0
 
-        # Create placeholders for the IN clause
-        placeholders = ','.join(['%s'] * len(ciks))
-        delete_query = f"DELETE FROM ticker_directory WHERE cik IN ({placeholders});"
+        delete_query = "DELETE FROM ticker_directory WHERE cik = ANY(%s::integer[]);"
 
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(delete_query, ciks)  # type: ignore[arg-type]
+            with self._cursor_context() as cursor:
+                cursor.execute(delete_query, (list(ciks),))
                 rows_deleted = cursor.rowcount
+                self._clear_cached()
                 self.logger.info(f"Successfully bulk deleted {rows_deleted} ticker directory entries by CIK")
                 return rows_deleted
 
         except Exception as e:
             raise DatabaseQueryError("bulk delete ticker directory by CIK", str(e))
-    
-    # ============================================================================
-    # HELPER METHODS
-    # ============================================================================
-    
-    def _row_to_entity(self, row: tuple[Any, ...]) -> TickerDirectory:
-        """
-        Convert a database row to a TickerDirectory entity.
-        
-        Args:
-            row: Database row tuple (cik, ticker, created_at, last_updated_at, status, id)
-        
-        Returns:
-            TickerDirectory entity
-        """
-        # Normalize DB enum (could be 'active' or 'ACTIVE') into our Enum
-        raw_status = row[4]
-        status_enum: TickerDirectoryStatus
-        if isinstance(raw_status, str):
-            try:
-                # Try mapping from uppercase of the raw label (our Enum uses uppercase labels)
-                status_enum = TickerDirectoryStatus(raw_status.upper())
-            except ValueError:
-                # As a last resort, try direct construction (this may raise)
-                status_enum = TickerDirectoryStatus(raw_status)
-        else:
-            # If driver returned an enum-like object, coerce to string then to enum
-            try:
-                status_enum = TickerDirectoryStatus(str(raw_status))
-            except Exception:
-                status_enum = TickerDirectoryStatus.ACTIVE
-
-        return TickerDirectory(
-            ticker=row[1],
-            cik=row[0],
-            status=status_enum,
-            id=row[5],
-            created_at=row[2],
-            last_updated_at=row[3]
-        )
@@ -3,15 +3,185 @@ Ticker overview repository for database operations.
 """
 
 import logging
-import psycopg
-from typing import List, Optional, Any
+from operator import attrgetter
+from psycopg.rows import class_row
+from typing import Dict, Iterator, List, Optional, Sequence, Any
 
-from .base_repository import BaseRepository
+from .base_repository import BULK_CHUNK_SIZE, COPY_THRESHOLD, BaseRepository
+from ..cache import Cache, TTLCache
 from ..models.ticker_overview import TickerOverview
 from ..database.connection_manager import DatabaseConnectionManager
 from ..exceptions import DatabaseQueryError
 
 
+# Single-row statements, executed with prepare=True so each pooled
+# connection parses and plans them once
+SELECT_BY_TICKER_QUERY = """
+SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+FROM ticker_overview
+WHERE ticker = %s;
+"""
+
+SELECT_MANY_BY_TICKER_QUERY = """
+SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+FROM ticker_overview
+WHERE ticker = ANY(%s::varchar[]);
+"""
+
+# Answers with a single boolean from one index probe on the primary key
+EXISTS_QUERY = "SELECT EXISTS (SELECT 1 FROM ticker_overview WHERE ticker = %s);"
+
+COUNT_QUERY = "SELECT COUNT(*) FROM ticker_overview;"
+
+# Planner's row estimate, kept up to date by VACUUM/ANALYZE; -1 if never analyzed
+APPROXIMATE_COUNT_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE oid = 'ticker_overview'::regclass;"
+
+# ON CONFLICT DO NOTHING reports a duplicate as an empty RETURNING instead of
+# an error, so no existence check is needed and a session transaction isn't aborted
+INSERT_QUERY = """
+INSERT INTO ticker_overview (
+    ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON CONFLICT (ticker) DO NOTHING
+RETURNING ticker;
+"""
+
+UPDATE_QUERY = """
+UPDATE ticker_overview
+SET enterprise_to_ebitda = %s, price_to_book = %s, gross_margin = %s,
+    operating_margin = %s, profit_margin = %s, earnings_growth = %s,
+    revenue_growth = %s, trailing_eps = %s, forward_eps = %s, peg_ratio = %s, ebitda_margin = %s
+WHERE ticker = %s
+RETURNING ticker;
+"""
+
+DELETE_QUERY = "DELETE FROM ticker_overview WHERE ticker = %s;"
+
+# Paginated with BaseRepository._paginate, which caches the SQL for each LIMIT/OFFSET shape
+SELECT_ALL_QUERY = """
+SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+FROM ticker_overview
+ORDER BY ticker
+"""
+
+# One array per column, in the order column_arrays() produces them
+UNNEST_SOURCE = """
+unnest(
+    %s::varchar[], %s::numeric[], %s::numeric[], %s::numeric[],
+    %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[],
+    %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[]
+)"""
+
+BULK_INSERT_QUERY = """
+INSERT INTO ticker_overview (
+    ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+)
+SELECT * FROM""" + UNNEST_SOURCE + """
+ON CONFLICT (ticker) DO NOTHING;
+"""
+
+BULK_UPDATE_QUERY = """
+UPDATE ticker_overview
+SET enterprise_to_ebitda = v.enterprise_to_ebitda, price_to_book = v.price_to_book,
+    gross_margin = v.gross_margin, operating_margin = v.operating_margin,
+    profit_margin = v.profit_margin, earnings_growth = v.earnings_growth,
+    revenue_growth = v.revenue_growth, trailing_eps = v.trailing_eps,
+    forward_eps = v.forward_eps, peg_ratio = v.peg_ratio, ebitda_margin = v.ebitda_margin
+FROM""" + UNNEST_SOURCE + """ AS v (
+    ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+)
+WHERE ticker_overview.ticker = v.ticker;
+"""
+
+# Rows whose values are unchanged are skipped, so they aren't rewritten or counted
+BULK_UPSERT_QUERY = """
+INSERT INTO ticker_overview (
+    ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+)
+SELECT * FROM""" + UNNEST_SOURCE + """
+ON CONFLICT (ticker) DO UPDATE
+SET enterprise_to_ebitda = EXCLUDED.enterprise_to_ebitda, price_to_book = EXCLUDED.price_to_book,
+    gross_margin = EXCLUDED.gross_margin, operating_margin = EXCLUDED.operating_margin,
+    profit_margin = EXCLUDED.profit_margin, earnings_growth = EXCLUDED.earnings_growth,
+    revenue_growth = EXCLUDED.revenue_growth, trailing_eps = EXCLUDED.trailing_eps,
+    forward_eps = EXCLUDED.forward_eps, peg_ratio = EXCLUDED.peg_ratio,
+    ebitda_margin = EXCLUDED.ebitda_margin
+WHERE (
+    ticker_overview.enterprise_to_ebitda, ticker_overview.price_to_book, ticker_overview.gross_margin,
+    ticker_overview.operating_margin, ticker_overview.profit_margin, ticker_overview.earnings_growth,
+    ticker_overview.revenue_growth, ticker_overview.trailing_eps, ticker_overview.forward_eps,
+    ticker_overview.peg_ratio, ticker_overview.ebitda_margin
+) IS DISTINCT FROM (
+    EXCLUDED.enterprise_to_ebitda, EXCLUDED.price_to_book, EXCLUDED.gross_margin,
+    EXCLUDED.operating_margin, EXCLUDED.profit_margin, EXCLUDED.earnings_growth,
+    EXCLUDED.revenue_growth, EXCLUDED.trailing_eps, EXCLUDED.forward_eps,
+    EXCLUDED.peg_ratio, EXCLUDED.ebitda_margin
+);
+"""
+
+# Large batches are COPYed into a staging table first, then inserted with one statement
+COPY_INSERT_QUERY = """
+INSERT INTO ticker_overview (
+    ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+)
+SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
+    operating_margin, profit_margin, earnings_growth, revenue_growth,
+    trailing_eps, forward_eps, peg_ratio, ebitda_margin
+FROM ticker_overview_staging
+ON CONFLICT (ticker) DO NOTHING;
+"""
+
+BULK_DELETE_QUERY = "DELETE FROM ticker_overview WHERE ticker = ANY(%s::varchar[]);"
+
+# Table columns in order; _ROW_VALUES reads them off an entity in one C-level call
+COLUMNS = (
+    "ticker", "enterprise_to_ebitda", "price_to_book", "gross_margin",
+    "operating_margin", "profit_margin", "earnings_growth", "revenue_growth",
+    "trailing_eps", "forward_eps", "peg_ratio", "ebitda_margin"
+)
+_ROW_VALUES = attrgetter(*COLUMNS)
+
+# Builds TickerOverview straight from result rows, matching columns to fields by name
+TICKER_OVERVIEW_ROW_FACTORY = class_row(TickerOverview)
+
+# Overviews change at most once per sync run, so get_by_ticker reads are cached briefly
+TICKER_OVERVIEW_CACHE_MAXSIZE = 4096
+TICKER_OVERVIEW_CACHE_TTL_SECONDS = 30
+
+
+def column_arrays(entities: Sequence[TickerOverview]) -> tuple[List[Any], ...]:
+    """
+    Turn entities into one list per column, for unnest()-based bulk statements.
+    
+    Args:
+        entities: TickerOverview entities to send
+    
+    Returns:
+        Tuple of column lists, in table column order starting with ticker
+    """
+    if not entities:
+        return tuple([] for _ in COLUMNS)
+    
+    return tuple(list(column) for column in zip(*map(_ROW_VALUES, entities)))
+
+
 class TickerOverviewNotFoundError(Exception):
     """Exception raised when a ticker overview is not found."""
     
@@ -34,18 +204,28 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
     Repository for ticker overview entities with full CRUD operations.
     Organized by: CREATE, READ, UPDATE, DELETE operations.
     Supports searching by ticker (primary key) and filtering by various metrics.
+    
+    Single-row statements run with prepare=True, so each pooled connection
+    parses and plans them once instead of on every call.
     """
     
-    def __init__(self, db_manager: DatabaseConnectionManager):
+    def __init__(self,
+                 db_manager: DatabaseConnectionManager,
+                 cache: Optional[Cache[str, TickerOverview]] = None):
         """
         Initialize the ticker overview repository.
         
         Args:
             db_manager: Database connection manager instance
+            cache: Cache for get_by_ticker results, keyed by ticker. Defaults to a
+                   private in-process TTLCache; pass a shared one to share entries.
         """
         super().__init__(db_manager)
         self.logger = logging.getLogger(__name__)
         self.table_name = "ticker_overview"
+        self._cache: Cache[str, TickerOverview] = cache if cache is not None else TTLCache(
+            TICKER_OVERVIEW_CACHE_MAXSIZE, TICKER_OVERVIEW_CACHE_TTL_SECONDS
+        )
     
     # ============================================================================
     # CREATE OPERATIONS
@@ -67,23 +247,10 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         """
         ticker_overview = entity
         
-        # Check if ticker already exists
-        if self.get_by_ticker(ticker_overview.ticker) is not None:
-            raise DuplicateTickerError(ticker_overview.ticker)
-        
-        insert_query = """
-        INSERT INTO ticker_overview (
-            ticker, enterprise_to_ebitda, price_to_book, gross_margin,
-            operating_margin, profit_margin, earnings_growth, revenue_growth,
-            trailing_eps, forward_eps, peg_ratio, ebitda_margin
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(
-                    insert_query,
+                    INSERT_QUERY,
                     (
                         ticker_overview.ticker,
                         ticker_overview.enterprise_to_ebitda,
@@ -97,13 +264,19 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
                         ticker_overview.forward_eps,
                         ticker_overview.peg_ratio,
                         ticker_overview.ebitda_margin
-                    )
+                    ),
+                    prepare=True
                 )
+                
+                if cursor.fetchone() is None:
+                    raise DuplicateTickerError(ticker_overview.ticker)
+                
+                self._invalidate_cached([ticker_overview.ticker])
                 self.logger.info(f"Successfully inserted ticker overview: {ticker_overview.ticker}")
                 return ticker_overview
 
-        except psycopg.errors.UniqueViolation:
-            raise DuplicateTickerError(ticker_overview.ticker)
+        except DuplicateTickerError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("insert ticker overview", str(e))
     
@@ -124,37 +297,22 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         if not entities:
             return 0
         
-        insert_query = """
-        INSERT INTO ticker_overview (
-            ticker, enterprise_to_ebitda, price_to_book, gross_margin,
-            operating_margin, profit_margin, earnings_growth, revenue_growth,
-            trailing_eps, forward_eps, peg_ratio, ebitda_margin
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (ticker) DO NOTHING;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        to.ticker,
-                        to.enterprise_to_ebitda,
-                        to.price_to_book,
-                        to.gross_margin,
-                        to.operating_margin,
-                        to.profit_margin,
-                        to.earnings_growth,
-                        to.revenue_growth,
-                        to.trailing_eps,
-                        to.forward_eps,
-                        to.peg_ratio,
-                        to.ebitda_margin
-                    )
-                    for to in entities
-                ]
-                cursor.executemany(insert_query, data)
-                rows_inserted = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_inserted = 0
+                
+                if len(entities) >= COPY_THRESHOLD:
+                    # Large batch: COPY into staging, then insert it with one statement
+                    self._copy_to_staging(cursor, "ticker_overview", COLUMNS, map(_ROW_VALUES, entities))
+                    cursor.execute(COPY_INSERT_QUERY)
+                    rows_inserted = cursor.rowcount
+                    self._drop_staging(cursor, "ticker_overview")
+                else:
+                    for chunk in self._chunks(entities):
+                        cursor.execute(BULK_INSERT_QUERY, column_arrays(chunk))
+                        rows_inserted += cursor.rowcount
+                
+                self._invalidate_cached(to.ticker for to in entities)
                 self.logger.info(f"Successfully bulk inserted {rows_inserted} ticker overviews")
                 return rows_inserted
 
@@ -168,6 +326,7 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
     def get_by_ticker(self, ticker: str) -> Optional[TickerOverview]:
         """
         Retrieve a ticker overview entry by its ticker symbol (primary key).
+        Served from the in-process cache when possible.
         
         Args:
             ticker: The ticker symbol to retrieve
@@ -178,27 +337,63 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        select_query = """
-        SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
-               operating_margin, profit_margin, earnings_growth, revenue_growth,
-             trailing_eps, forward_eps, peg_ratio, ebitda_margin
-        FROM ticker_overview
-        WHERE ticker = %s;
-        """
+        ticker = ticker.upper()
+        cached = self._get_cached(ticker)
+        if cached is not None:
+            return cached
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (ticker.upper(),))
-                row = cursor.fetchone()
-
-                if row is None:
-                    return None
-
-                return self._row_to_entity(row)
+            with self._cursor_context(commit=False, row_factory=TICKER_OVERVIEW_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_BY_TICKER_QUERY, (ticker,), prepare=True)
+                ticker_overview = cursor.fetchone()
+                
+                if ticker_overview is not None:
+                    self._set_cached(ticker, ticker_overview)
+                return ticker_overview
 
         except Exception as e:
             raise DatabaseQueryError("get ticker overview by ticker", str(e))
     
+    def get_many_by_tickers(self, tickers: List[str]) -> Dict[str, TickerOverview]:
+        """
+        Retrieve several ticker overview entries in one query.
+        Tickers already in the cache are served from it; the rest are read with
+        a single ANY() lookup instead of one SELECT each.
+        
+        Args:
+            tickers: The ticker symbols to retrieve
+        
+        Returns:
+            Dictionary mapping each found ticker to its TickerOverview; missing tickers are absent
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        ticker_overviews: Dict[str, TickerOverview] = {}
+        missing: List[str] = []
+        for ticker in {ticker.upper() for ticker in tickers}:
+            cached = self._get_cached(ticker)
+            if cached is not None:
+                ticker_overviews[ticker] = cached
+            else:
+                missing.append(ticker)
+        
+        if not missing:
+            return ticker_overviews
+        
+        try:
+            with self._cursor_context(commit=False, row_factory=TICKER_OVERVIEW_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_MANY_BY_TICKER_QUERY, (missing,), prepare=True)
+                
+                for ticker_overview in cursor.fetchall():
+                    ticker_overviews[ticker_overview.ticker] = ticker_overview
+                    self._set_cached(ticker_overview.ticker, ticker_overview)
+                
+                return ticker_overviews
+
+        except Exception as e:
+            raise DatabaseQueryError("get ticker overviews by tickers", str(e))
+    
     def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[TickerOverview]:
         """
         Retrieve all ticker overview entries with optional pagination.
@@ -213,49 +408,62 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query_parts = ["""
-        SELECT ticker, enterprise_to_ebitda, price_to_book, gross_margin,
-               operating_margin, profit_margin, earnings_growth, revenue_growth,
-             trailing_eps, forward_eps, peg_ratio, ebitda_margin
-        FROM ticker_overview
-        ORDER BY ticker"""]
+        query, params = self._paginate(SELECT_ALL_QUERY, limit, offset)
         
-        params: List[int] = []
+        try:
+            with self._cursor_context(commit=False, row_factory=TICKER_OVERVIEW_ROW_FACTORY) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DatabaseQueryError("get all ticker overviews", str(e))
+    
+    def iter_all(self, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[TickerOverview]:
+        """
+        Iterate over all ticker overview entries without loading the table into memory.
+        Prefer this over get_all() for full-table scans.
         
-        if limit is not None:
-            query_parts.append(" LIMIT %s")
-            params.append(limit)
-        if offset is not None:
-            query_parts.append(" OFFSET %s")
-            params.append(offset)
+        Args:
+            chunk_size: Number of rows fetched from the server per round trip
         
-        query = "".join(query_parts) + ";"
+        Yields:
+            TickerOverview entries ordered by ticker
         
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, params)  # type: ignore[arg-type]
-                rows = cursor.fetchall()
-
-                return [self._row_to_entity(row) for row in rows]
+            yield from self._stream_rows(
+                SELECT_ALL_QUERY, chunk_size=chunk_size, row_factory=TICKER_OVERVIEW_ROW_FACTORY
+            )
 
         except Exception as e:
-            raise DatabaseQueryError("get all ticker overviews", str(e))
+            raise DatabaseQueryError("iterate ticker overviews", str(e))
     
-    def count(self) -> int:
+    def count(self, approximate: bool = False) -> int:
         """
         Count the total number of ticker overview entries.
         
+        Args:
+            approximate: Return the planner's row estimate from pg_class instead of
+                         scanning the table. Falls back to an exact count if the
+                         table has never been analyzed.
+        
         Returns:
             Total count of entries
         
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        count_query = "SELECT COUNT(*) FROM ticker_overview;"
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(count_query)
+            with self._cursor_context(commit=False) as cursor:
+                if approximate:
+                    cursor.execute(APPROXIMATE_COUNT_QUERY, prepare=True)
+                    result = cursor.fetchone()
+                    if result and result[0] >= 0:
+                        return result[0]
+                
+                cursor.execute(COUNT_QUERY, prepare=True)
                 result = cursor.fetchone()
                 return result[0] if result else 0
 
@@ -275,12 +483,15 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query = "SELECT 1 FROM ticker_overview WHERE ticker = %s LIMIT 1;"
+        ticker = ticker.upper()
+        if ticker in self._cache:
+            return True
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, (ticker.upper(),))
-                return cursor.fetchone() is not None
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(EXISTS_QUERY, (ticker,), prepare=True)
+                result = cursor.fetchone()
+                return bool(result[0]) if result else False
 
         except Exception as e:
             raise DatabaseQueryError("check ticker existence", str(e))
@@ -305,23 +516,10 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         """
         ticker_overview = entity
         
-        # Check if the ticker exists
-        existing = self.get_by_ticker(ticker_overview.ticker)
-        if existing is None:
-            raise TickerOverviewNotFoundError("ticker", ticker_overview.ticker)
-        
-        update_query = """
-        UPDATE ticker_overview
-        SET enterprise_to_ebitda = %s, price_to_book = %s, gross_margin = %s,
-            operating_margin = %s, profit_margin = %s, earnings_growth = %s,
-            revenue_growth = %s, trailing_eps = %s, forward_eps = %s, peg_ratio = %s, ebitda_margin = %s
-        WHERE ticker = %s;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(
-                    update_query,
+                    UPDATE_QUERY,
                     (
                         ticker_overview.enterprise_to_ebitda,
                         ticker_overview.price_to_book,
@@ -335,11 +533,20 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
                         ticker_overview.peg_ratio,
                         ticker_overview.ebitda_margin,
                         ticker_overview.ticker
-                    )
+                    ),
+                    prepare=True
                 )
+                
+                # No row back from RETURNING means the ticker doesn't exist
+                if cursor.fetchone() is None:
+                    raise TickerOverviewNotFoundError("ticker", ticker_overview.ticker)
+                
+                self._invalidate_cached([ticker_overview.ticker])
                 self.logger.info(f"Successfully updated ticker overview: {ticker_overview.ticker}")
                 return ticker_overview
 
+        except TickerOverviewNotFoundError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("update ticker overview", str(e))
     
@@ -359,41 +566,55 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         if not entities:
             return 0
         
-        update_query = """
-        UPDATE ticker_overview
-        SET enterprise_to_ebitda = %s, price_to_book = %s, gross_margin = %s,
-            operating_margin = %s, profit_margin = %s, earnings_growth = %s,
-            revenue_growth = %s, trailing_eps = %s, forward_eps = %s, peg_ratio = %s, ebitda_margin = %s
-        WHERE ticker = %s;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        to.enterprise_to_ebitda,
-                        to.price_to_book,
-                        to.gross_margin,
-                        to.operating_margin,
-                        to.profit_margin,
-                        to.earnings_growth,
-                        to.revenue_growth,
-                        to.trailing_eps,
-                        to.forward_eps,
-                        to.peg_ratio,
-                        to.ebitda_margin,
-                        to.ticker
-                    )
-                    for to in entities
-                ]
-                cursor.executemany(update_query, data)
-                rows_updated = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_updated = 0
+                
+                for chunk in self._chunks(entities):
+                    cursor.execute(BULK_UPDATE_QUERY, column_arrays(chunk))
+                    rows_updated += cursor.rowcount
+                
+                self._invalidate_cached(to.ticker for to in entities)
                 self.logger.info(f"Successfully bulk updated {rows_updated} ticker overviews")
                 return rows_updated
 
         except Exception as e:
             raise DatabaseQueryError("bulk update ticker overviews", str(e))
     
+    def bulk_upsert(self, entities: List[TickerOverview]) -> int:
+        """
+        Insert or update multiple ticker overview entries in a single transaction.
+        Unlike bulk_update, tickers not yet in the table are inserted, and callers
+        don't need to split new and existing entries first. Entries whose values
+        already match the table are left untouched.
+        
+        Args:
+            entities: List of TickerOverview entities to write (tickers must be unique)
+        
+        Returns:
+            Number of rows inserted or changed
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        if not entities:
+            return 0
+        
+        try:
+            with self._cursor_context() as cursor:
+                rows_upserted = 0
+                
+                for chunk in self._chunks(entities):
+                    cursor.execute(BULK_UPSERT_QUERY, column_arrays(chunk))
+                    rows_upserted += cursor.rowcount
+                
+                self._invalidate_cached(to.ticker for to in entities)
+                self.logger.info(f"Successfully bulk upserted {rows_upserted} ticker overviews")
+                return rows_upserted
+
+        except Exception as e:
+            raise DatabaseQueryError("bulk upsert ticker overviews", str(e))
+    
     # ============================================================================
     # DELETE OPERATIONS
     # ============================================================================
@@ -411,14 +632,13 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        delete_query = "DELETE FROM ticker_overview WHERE ticker = %s;"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(delete_query, (entity_id.upper(),))
+            with self._cursor_context() as cursor:
+                cursor.execute(DELETE_QUERY, (entity_id.upper(),), prepare=True)
                 rows_deleted = cursor.rowcount
 
                 if rows_deleted > 0:
+                    self._invalidate_cached([entity_id.upper()])
                     self.logger.info(f"Successfully deleted ticker overview: {entity_id}")
                     return True
                 else:
@@ -444,47 +664,15 @@ class TickerOverviewRepository(BaseRepository[TickerOverview]):
         if not entity_ids:
             return 0
         
-        # Create placeholders for the IN clause
-        placeholders = ','.join(['%s'] * len(entity_ids))
-        delete_query = f"DELETE FROM ticker_overview WHERE ticker IN ({placeholders});"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                # Convert all tickers to uppercase
+            with self._cursor_context() as cursor:
+                # Tickers are stored upper-cased, so compare against the primary key directly
                 upper_tickers = [ticker.upper() for ticker in entity_ids]
-                cursor.execute(delete_query, upper_tickers)  # type: ignore[arg-type]
+                cursor.execute(BULK_DELETE_QUERY, (upper_tickers,))
                 rows_deleted = cursor.rowcount
+                self._invalidate_cached(upper_tickers)
                 self.logger.info(f"Successfully bulk deleted {rows_deleted} ticker overviews")
                 return rows_deleted
 
         except Exception as e:
             raise DatabaseQueryError("bulk delete ticker overviews", str(e))
-    
-    # ============================================================================
-    # HELPER METHODS
-    # ============================================================================
-    
-    def _row_to_entity(self, row: tuple[Any, ...]) -> TickerOverview:
-        """
-        Convert a database row to a TickerOverview entity.
-        
-        Args:
-            row: Database row tuple
-        
-        Returns:
-            TickerOverview entity
-        """
-        return TickerOverview(
-            ticker=row[0],
-            enterprise_to_ebitda=row[1],
-            price_to_book=row[2],
-            gross_margin=row[3],
-            operating_margin=row[4],
-            profit_margin=row[5],
-            earnings_growth=row[6],
-            revenue_growth=row[7],
-            trailing_eps=row[8],
-            forward_eps=row[9],
-            peg_ratio=row[10],
-            ebitda_margin=row[11]
-        )
@@ -3,15 +3,200 @@ Ticker summary repository for database operations.
 """
 
 import logging
-import psycopg
-from typing import List, Optional, Any
+from operator import attrgetter
+from psycopg.rows import class_row, dict_row
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
 
-from .base_repository import BaseRepository
+from .base_repository import BULK_CHUNK_SIZE, COPY_THRESHOLD, BaseRepository
+from ..cache import Cache, TTLCache
 from ..models.ticker_summary import TickerSummary
 from ..database.connection_manager import DatabaseConnectionManager
 from ..exceptions import DatabaseQueryError
 
 
+# Single-row statements, executed with prepare=True so each pooled
+# connection parses and plans them once
+SELECT_BY_TICKER_QUERY = """
+SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+FROM ticker_summary
+WHERE ticker = %s;
+"""
+
+SELECT_PAGE_QUERY = """
+SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield,
+    COUNT(*) OVER () AS total
+FROM ticker_summary
+ORDER BY ticker
+LIMIT %s OFFSET %s;
+"""
+
+EXISTS_QUERY = "SELECT 1 FROM ticker_summary WHERE ticker = %s LIMIT 1;"
+
+COUNT_QUERY = "SELECT COUNT(*) FROM ticker_summary;"
+
+# Paginated with BaseRepository._paginate, which caches the SQL for each LIMIT/OFFSET shape
+SELECT_ALL_QUERY = """
+SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+FROM ticker_summary
+ORDER BY ticker
+"""
+
+SELECT_ALL_AFTER_QUERY = """
+SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+FROM ticker_summary
+WHERE ticker > %s
+ORDER BY ticker
+"""
+
+INSERT_QUERY = """
+INSERT INTO ticker_summary (
+    ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON CONFLICT (ticker) DO NOTHING
+RETURNING ticker;
+"""
+
+UPDATE_QUERY = """
+UPDATE ticker_summary
+SET cik = %s, market_cap = %s, previous_close = %s, pe_ratio = %s,
+    forward_pe_ratio = %s, dividend_yield = %s, payout_ratio = %s,
+    fifty_day_average = %s, two_hundred_day_average = %s, annual_dividend_growth = %s, five_year_avg_dividend_yield = %s
+WHERE ticker = %s
+RETURNING ticker;
+"""
+
+DELETE_QUERY = "DELETE FROM ticker_summary WHERE ticker = %s;"
+
+# Summaries change at most once per sync run, so get_by_ticker reads are cached briefly
+TICKER_SUMMARY_CACHE_MAXSIZE = 4096
+TICKER_SUMMARY_CACHE_TTL_SECONDS = 30
+
+# Builds TickerSummary straight from result rows, matching columns to fields by name
+TICKER_SUMMARY_ROW_FACTORY = class_row(TickerSummary)
+
+# One array per column, in the order column_arrays() produces them
+UNNEST_SOURCE = """
+unnest(
+    %s::varchar[], %s::integer[], %s::bigint[], %s::numeric[], %s::numeric[],
+    %s::numeric[], %s::numeric[], %s::numeric[],
+    %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[]
+)"""
+
+BULK_INSERT_QUERY = """
+INSERT INTO ticker_summary (
+    ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+)
+SELECT * FROM""" + UNNEST_SOURCE + """
+ON CONFLICT (ticker) DO NOTHING;
+"""
+
+BULK_UPDATE_QUERY = """
+UPDATE ticker_summary
+SET cik = v.cik, market_cap = v.market_cap, previous_close = v.previous_close, pe_ratio = v.pe_ratio,
+    forward_pe_ratio = v.forward_pe_ratio, dividend_yield = v.dividend_yield, payout_ratio = v.payout_ratio,
+    fifty_day_average = v.fifty_day_average, two_hundred_day_average = v.two_hundred_day_average,
+    annual_dividend_growth = v.annual_dividend_growth, five_year_avg_dividend_yield = v.five_year_avg_dividend_yield
+FROM""" + UNNEST_SOURCE + """ AS v (
+    ticker, cik, market_cap, previous_close, pe_ratio,
+    forward_pe_ratio, dividend_yield, payout_ratio,
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+)
+WHERE ticker_summary.ticker = v.ticker;
+"""
+
+# Large batches are COPYed into a staging table first, then inserted with one statement
+COPY_INSERT_QUERY = """
+INSERT INTO ticker_summary (
+    ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+)
+SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+    forward_pe_ratio, dividend_yield, payout_ratio, 
+    fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+FROM ticker_summary_staging
+ON CONFLICT (ticker) DO NOTHING;
+"""
+
+BULK_DELETE_QUERY = "DELETE FROM ticker_summary WHERE ticker = ANY(%s::varchar[]);"
+
+BULK_DELETE_BY_CIK_QUERY = "DELETE FROM ticker_summary WHERE cik = ANY(%s::integer[]);"
+
+
+# Table columns in order; _ROW_VALUES reads them off an entity in one call
+COLUMNS = (
+    "ticker", "cik", "market_cap", "previous_close", "pe_ratio",
+    "forward_pe_ratio", "dividend_yield", "payout_ratio",
+    "fifty_day_average", "two_hundred_day_average", "annual_dividend_growth", "five_year_avg_dividend_yield"
+)
+_ROW_VALUES = attrgetter(*COLUMNS)
+
+
+def column_arrays(entities: Sequence[TickerSummary]) -> tuple[List[Any], ...]:
+    """
+    Turn entities into one list per column, for unnest()-based bulk statements.
+    
+    Args:
+        entities: TickerSummary entities to send
+    
+    Returns:
+        Tuple of column lists, in table column order starting with ticker
+    """
+    columns: tuple[List[Any], ...] = tuple([] for _ in range(12))
+    (tickers, ciks, market_caps, previous_closes, pe_ratios,
+     forward_pe_ratios, dividend_yields, payout_ratios,
+     fifty_day_averages, two_hundred_day_averages,
+     annual_dividend_growths, five_year_avg_dividend_yields) = columns
+    
+    for ts in entities:
+        tickers.append(ts.ticker)
+        ciks.append(ts.cik)
+        market_caps.append(ts.market_cap)
+        previous_closes.append(ts.previous_close)
+        pe_ratios.append(ts.pe_ratio)
+        forward_pe_ratios.append(ts.forward_pe_ratio)
+        dividend_yields.append(ts.dividend_yield)
+        payout_ratios.append(ts.payout_ratio)
+        fifty_day_averages.append(ts.fifty_day_average)
+        two_hundred_day_averages.append(ts.two_hundred_day_average)
+        annual_dividend_growths.append(ts.annual_dividend_growth)
+        five_year_avg_dividend_yields.append(ts.five_year_avg_dividend_yield)
+    
+    return columns
+
+
+def page_from_rows(rows: Iterable[Dict[str, Any]]) -> Tuple[List[TickerSummary], int]:
+    """
+    Split SELECT_PAGE_QUERY rows (read with dict_row) into entities and the window total.
+    
+    Args:
+        rows: Result rows, each with the entity columns plus total
+    
+    Returns:
+        Tuple of (entries on this page, total number of entries). The total is 0
+        when there are no rows.
+    """
+    ticker_summaries: List[TickerSummary] = []
+    total = 0
+    for row in rows:
+        total = row.pop("total")
+        ticker_summaries.append(TickerSummary(**row))
+    return ticker_summaries, total
+
+
 class TickerSummaryNotFoundError(Exception):
     """Exception raised when a ticker summary is not found."""
     
@@ -34,18 +219,28 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
     Repository for ticker summary entities with full CRUD operations.
     Organized by: CREATE, READ, UPDATE, DELETE operations.
     Supports searching by ticker (primary key) and filtering by various metrics.
+    
+    Single-row statements run with prepare=True, so each pooled connection
+    parses and plans them once instead of on every call.
     """
     
-    def __init__(self, db_manager: DatabaseConnectionManager):
+    def __init__(self,
+                 db_manager: DatabaseConnectionManager,
+                 cache: Optional[Cache[str, TickerSummary]] = None):
         """
         Initialize the ticker summary repository.
         
         Args:
             db_manager: Database connection manager instance
+            cache: Cache for get_by_ticker results, keyed by ticker. Defaults to a
+                   private in-process TTLCache; pass a shared one to share entries.
         """
         super().__init__(db_manager)
         self.logger = logging.getLogger(__name__)
         self.table_name = "ticker_summary"
+        self._cache: Cache[str, TickerSummary] = cache if cache is not None else TTLCache(
+            TICKER_SUMMARY_CACHE_MAXSIZE, TICKER_SUMMARY_CACHE_TTL_SECONDS
+        )
     
     # ============================================================================
     # CREATE OPERATIONS
@@ -67,24 +262,13 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         """
         ticker_summary = entity
         
-        # Check if ticker already exists
-        if self.get_by_ticker(ticker_summary.ticker) is not None:
-            raise DuplicateTickerError(ticker_summary.ticker)
-        
-        insert_query = """
-        INSERT INTO ticker_summary (
-            ticker, cik, market_cap, previous_close, pe_ratio, 
-            forward_pe_ratio, dividend_yield, payout_ratio, 
-            fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
-        """
-        
+        # ON CONFLICT DO NOTHING reports a duplicate as an empty RETURNING instead of
+        # an error, so no existence check is needed and a session transaction isn't aborted
         try:
             # Use connection manager cursor context to ensure connection is returned to the pool
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(
-                    insert_query,
+                    INSERT_QUERY,
                     (
                         ticker_summary.ticker,
                         ticker_summary.cik,
@@ -98,13 +282,19 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
                         ticker_summary.two_hundred_day_average,
                         ticker_summary.annual_dividend_growth,
                         ticker_summary.five_year_avg_dividend_yield
-                    )
+                    ),
+                    prepare=True
                 )
+                
+                if cursor.fetchone() is None:
+                    raise DuplicateTickerError(ticker_summary.ticker)
+                
+                self._invalidate_cached([ticker_summary.ticker])
                 self.logger.info(f"Successfully inserted ticker summary: {ticker_summary.ticker}")
                 return ticker_summary
 
-        except psycopg.errors.UniqueViolation:
-            raise DuplicateTickerError(ticker_summary.ticker)
+        except DuplicateTickerError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("insert ticker summary", str(e))
     
@@ -125,38 +315,23 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         if not entities:
             return 0
         
-        insert_query = """
-        INSERT INTO ticker_summary (
-            ticker, cik, market_cap, previous_close, pe_ratio, 
-            forward_pe_ratio, dividend_yield, payout_ratio, 
-            fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (ticker) DO NOTHING;
-        """
-        
         try:
             # Use cursor context which returns connections to the pool automatically
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        ts.ticker,
-                        ts.cik,
-                        ts.market_cap,
-                        ts.previous_close,
-                        ts.pe_ratio,
-                        ts.forward_pe_ratio,
-                        ts.dividend_yield,
-                        ts.payout_ratio,
-                        ts.fifty_day_average,
-                        ts.two_hundred_day_average,
-                        ts.annual_dividend_growth,
-                        ts.five_year_avg_dividend_yield
-                    )
-                    for ts in entities
-                ]
-                cursor.executemany(insert_query, data)
-                rows_inserted = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_inserted = 0
+                
+                if len(entities) >= COPY_THRESHOLD:
+                    # Large batch: COPY into staging, then insert it with one statement
+                    self._copy_to_staging(cursor, "ticker_summary", COLUMNS, map(_ROW_VALUES, entities))
+                    cursor.execute(COPY_INSERT_QUERY)
+                    rows_inserted = cursor.rowcount
+                    self._drop_staging(cursor, "ticker_summary")
+                else:
+                    for chunk in self._chunks(entities):
+                        cursor.execute(BULK_INSERT_QUERY, column_arrays(chunk))
+                        rows_inserted += cursor.rowcount
+                
+                self._invalidate_cached(ts.ticker for ts in entities)
                 self.logger.info(f"Successfully bulk inserted {rows_inserted} ticker summaries")
                 return rows_inserted
 
@@ -170,6 +345,7 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
     def get_by_ticker(self, ticker: str) -> Optional[TickerSummary]:
         """
         Retrieve a ticker summary entry by its ticker symbol (primary key).
+        Served from the in-process cache when possible.
         
         Args:
             ticker: The ticker symbol to retrieve
@@ -180,34 +356,37 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        select_query = """
-         SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
-             forward_pe_ratio, dividend_yield, payout_ratio, 
-             fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
-        FROM ticker_summary
-        WHERE ticker = %s;
-        """
+        ticker = ticker.upper()
+        cached = self._get_cached(ticker)
+        if cached is not None:
+            return cached
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(select_query, (ticker.upper(),))
-                row = cursor.fetchone()
-
-                if row is None:
-                    return None
-
-                return self._row_to_entity(row)
+            with self._cursor_context(commit=False, row_factory=TICKER_SUMMARY_ROW_FACTORY) as cursor:
+                cursor.execute(SELECT_BY_TICKER_QUERY, (ticker,), prepare=True)
+                ticker_summary = cursor.fetchone()
+                
+                if ticker_summary is not None:
+                    self._set_cached(ticker, ticker_summary)
+                return ticker_summary
 
         except Exception as e:
             raise DatabaseQueryError("get ticker summary by ticker", str(e))
     
-    def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[TickerSummary]:
+    def get_all(self,
+                limit: Optional[int] = None,
+                offset: Optional[int] = None,
+                after_ticker: Optional[str] = None) -> List[TickerSummary]:
         """
         Retrieve all ticker summary entries with optional pagination.
+        For deep pagination pass the last ticker of the previous page as after_ticker
+        rather than an offset: the primary key seeks straight to it, while OFFSET
+        still reads and discards every skipped row.
         
         Args:
             limit: Maximum number of entries to return
             offset: Number of entries to skip
+            after_ticker: Only return entries whose ticker sorts after this one
         
         Returns:
             List of TickerSummary entries
@@ -215,34 +394,72 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        # Use parameterized query parts for safe SQL construction
-        query_parts = ["""
-         SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
-            forward_pe_ratio, dividend_yield, payout_ratio, 
-            fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
-        FROM ticker_summary
-        ORDER BY ticker"""]
+        if after_ticker is not None:
+            query, params = self._paginate(SELECT_ALL_AFTER_QUERY, limit, offset, (after_ticker.upper(),))
+        else:
+            query, params = self._paginate(SELECT_ALL_QUERY, limit, offset)
         
-        params: List[int] = []
+        try:
+            with self._cursor_context(commit=False, row_factory=TICKER_SUMMARY_ROW_FACTORY) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DatabaseQueryError("get all ticker summaries", str(e))
+    
+    def get_page(self, limit: int, offset: int = 0) -> Tuple[List[TickerSummary], int]:
+        """
+        Retrieve one page of ticker summary entries together with the total count.
+        Uses a window count so the page and the total come from a single query,
+        instead of calling count() and get_all() separately.
         
-        if limit is not None:
-            query_parts.append(" LIMIT %s")
-            params.append(limit)
-        if offset is not None:
-            query_parts.append(" OFFSET %s")
-            params.append(offset)
+        Args:
+            limit: Maximum number of entries to return
+            offset: Number of entries to skip
         
-        query = "".join(query_parts) + ";"
+        Returns:
+            Tuple of (entries on this page, total number of entries). The total is 0
+            when the page is past the end of the table.
         
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, params)  # type: ignore[arg-type]
-                rows = cursor.fetchall()
+            with self._cursor_context(commit=False, row_factory=dict_row) as cursor:
+                cursor.execute(SELECT_PAGE_QUERY, (limit, offset), prepare=True)
+                return page_from_rows(cursor.fetchall())
 
-                return [self._row_to_entity(row) for row in rows]
+        except Exception as e:
+            raise DatabaseQueryError("get ticker summary page", str(e))
+    
+    def iter_all(self, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[TickerSummary]:
+        """
+        Iterate over all ticker summary entries without loading the table into memory.
+        Prefer this over get_all() for full-table scans.
+        
+        Args:
+            chunk_size: Number of rows fetched from the server per round trip
+        
+        Yields:
+            TickerSummary entries ordered by ticker
+        
+        Raises:
+            DatabaseQueryError: If database operation fails
+        """
+        select_query = """
+        SELECT ticker, cik, market_cap, previous_close, pe_ratio, 
+            forward_pe_ratio, dividend_yield, payout_ratio, 
+            fifty_day_average, two_hundred_day_average, annual_dividend_growth, five_year_avg_dividend_yield
+        FROM ticker_summary
+        ORDER BY ticker;
+        """
+        try:
+            yield from self._stream_rows(
+                select_query, chunk_size=chunk_size, row_factory=TICKER_SUMMARY_ROW_FACTORY
+            )
 
         except Exception as e:
-            raise DatabaseQueryError("get all ticker summaries", str(e))
+            raise DatabaseQueryError("iterate ticker summaries", str(e))
     
     def count(self) -> int:
         """
@@ -254,11 +471,9 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        count_query = "SELECT COUNT(*) FROM ticker_summary;"
-        
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(count_query)
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(COUNT_QUERY, prepare=True)
                 result = cursor.fetchone()
                 return result[0] if result else 0
 
@@ -278,11 +493,12 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        query = "SELECT 1 FROM ticker_summary WHERE ticker = %s LIMIT 1;"
+        if ticker.upper() in self._cache:
+            return True
         
         try:
-            with self.db_manager.get_cursor_context(commit=False) as cursor:
-                cursor.execute(query, (ticker.upper(),))
+            with self._cursor_context(commit=False) as cursor:
+                cursor.execute(EXISTS_QUERY, (ticker.upper(),), prepare=True)
                 return cursor.fetchone() is not None
 
         except Exception as e:
@@ -308,23 +524,10 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         """
         ticker_summary = entity
         
-        # Check if the ticker exists
-        existing = self.get_by_ticker(ticker_summary.ticker)
-        if existing is None:
-            raise TickerSummaryNotFoundError("ticker", ticker_summary.ticker)
-        
-        update_query = """
-        UPDATE ticker_summary
-        SET cik = %s, market_cap = %s, previous_close = %s, pe_ratio = %s,
-            forward_pe_ratio = %s, dividend_yield = %s, payout_ratio = %s,
-            fifty_day_average = %s, two_hundred_day_average = %s, annual_dividend_growth = %s, five_year_avg_dividend_yield = %s
-        WHERE ticker = %s;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
+            with self._cursor_context() as cursor:
                 cursor.execute(
-                    update_query,
+                    UPDATE_QUERY,
                     (
                         ticker_summary.cik,
                         ticker_summary.market_cap,
@@ -338,11 +541,20 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
                         ticker_summary.annual_dividend_growth,
                         ticker_summary.five_year_avg_dividend_yield,
                         ticker_summary.ticker
-                    )
+                    ),
+                    prepare=True
                 )
+                
+                # No row back from RETURNING means the ticker doesn't exist
+                if cursor.fetchone() is None:
+                    raise TickerSummaryNotFoundError("ticker", ticker_summary.ticker)
+                
+                self._invalidate_cached([ticker_summary.ticker])
                 self.logger.info(f"Successfully updated ticker summary: {ticker_summary.ticker}")
                 return ticker_summary
 
+        except TickerSummaryNotFoundError:
+            raise
         except Exception as e:
             raise DatabaseQueryError("update ticker summary", str(e))
     
@@ -362,35 +574,15 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         if not entities:
             return 0
         
-        update_query = """
-        UPDATE ticker_summary
-        SET cik = %s, market_cap = %s, previous_close = %s, pe_ratio = %s,
-            forward_pe_ratio = %s, dividend_yield = %s, payout_ratio = %s,
-            fifty_day_average = %s, two_hundred_day_average = %s, annual_dividend_growth = %s, five_year_avg_dividend_yield = %s
-        WHERE ticker = %s;
-        """
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                data = [
-                    (
-                        ts.cik,
-                        ts.market_cap,
-                        ts.previous_close,
-                        ts.pe_ratio,
-                        ts.forward_pe_ratio,
-                        ts.dividend_yield,
-                        ts.payout_ratio,
-                        ts.fifty_day_average,
-                        ts.two_hundred_day_average,
-                        ts.annual_dividend_growth,
-                        ts.five_year_avg_dividend_yield,
-                        ts.ticker
-                    )
-                    for ts in entities
-                ]
-                cursor.executemany(update_query, data)
-                rows_updated = cursor.rowcount
+            with self._cursor_context() as cursor:
+                rows_updated = 0
+                
+                for chunk in self._chunks(entities):
+                    cursor.execute(BULK_UPDATE_QUERY, column_arrays(chunk))
+                    rows_updated += cursor.rowcount
+                
+                self._invalidate_cached(ts.ticker for ts in entities)
                 self.logger.info(f"Successfully bulk updated {rows_updated} ticker summaries")
                 return rows_updated
 
@@ -414,14 +606,13 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         Raises:
             DatabaseQueryError: If database operation fails
         """
-        delete_query = "DELETE FROM ticker_summary WHERE ticker = %s;"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(delete_query, (entity_id.upper(),))
+            with self._cursor_context() as cursor:
+                cursor.execute(DELETE_QUERY, (entity_id.upper(),), prepare=True)
                 rows_deleted = cursor.rowcount
 
                 if rows_deleted > 0:
+                    self._invalidate_cached([entity_id.upper()])
                     self.logger.info(f"Successfully deleted ticker summary: {entity_id}")
                     return True
                 else:
@@ -447,16 +638,13 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         if not entity_ids:
             return 0
         
-        # Create placeholders for the IN clause
-        placeholders = ','.join(['%s'] * len(entity_ids))
-        delete_query = f"DELETE FROM ticker_summary WHERE ticker IN ({placeholders});"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                # Convert all tickers to uppercase
+            with self._cursor_context() as cursor:
+                # Tickers are stored upper-cased, so compare against the primary key directly
                 upper_tickers = [ticker.upper() for ticker in entity_ids]
-                cursor.execute(delete_query, upper_tickers)  # type: ignore[arg-type]
+                cursor.execute(BULK_DELETE_QUERY, (upper_tickers,))
                 rows_deleted = cursor.rowcount
+                self._invalidate_cached(upper_tickers)
                 self.logger.info(f"Successfully bulk deleted {rows_deleted} ticker summaries")
                 return rows_deleted
 
@@ -479,45 +667,14 @@ class TickerSummaryRepository(BaseRepository[TickerSummary]):
         if not ciks:
             return 0
         
-        # Create placeholders for the IN clause
-        placeholders = ','.join(['%s'] * len(ciks))
-        delete_query = f"DELETE FROM ticker_summary WHERE cik IN ({placeholders});"
-        
         try:
-            with self.db_manager.get_cursor_context() as cursor:
-                cursor.execute(delete_query, ciks)  # type: ignore[arg-type]
+            with self._cursor_context() as cursor:
+                cursor.execute(BULK_DELETE_BY_CIK_QUERY, (list(ciks),))
                 rows_deleted = cursor.rowcount
+                # The deleted tickers aren't known here, so drop everything cached
+                self._clear_cached()
                 self.logger.info(f"Successfully bulk deleted {rows_deleted} ticker summaries by CIK")
                 return rows_deleted
 
         except Exception as e:
             raise DatabaseQueryError("bulk delete ticker summaries by CIK", str(e))
-    
-    # ============================================================================
-    # HELPER METHODS
-    # ============================================================================
-    
-    def _row_to_entity(self, row: tuple[Any, ...]) -> TickerSummary:
-        """
-        Convert a database row to a TickerSummary entity.
-        
-        Args:
-            row: Database row tuple
-        
-        Returns:
-            TickerSummary entity
-        """
-        return TickerSummary(
-            ticker=row[0],
-            cik=row[1],
-            market_cap=row[2],
-            previous_close=row[3],
-            pe_ratio=row[4],
-            forward_pe_ratio=row[5],
-            dividend_yield=row[6],
-            payout_ratio=row[7],
-            fifty_day_average=row[8],
-            two_hundred_day_average=row[9],
-            annual_dividend_growth=row[10],
-            five_year_avg_dividend_yield=row[11]
-        )
@@ -140,8 +140,7 @@ def main():
         
         # 2. Get current database state
         logger.info("Retrieving current database state...")
-        database_cik_list = cik_repo.get_all()
-        database_ciks = {cik_lookup.cik: cik_lookup for cik_lookup in database_cik_list}
+        database_ciks = {cik_lookup.cik: cik_lookup for cik_lookup in cik_repo.iter_all()}
         logger.info(f"Found {len(database_ciks)} CIK entries currently in database")
         
         # 3. Process tickers in batches: lookup CIKs and persist immediately
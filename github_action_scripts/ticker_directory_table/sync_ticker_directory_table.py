@@ -147,8 +147,7 @@ def main():
         
         # 3. Get current database state (all entries)
         logger.info("Retrieving current database state...")
-        database_entries = ticker_directory_repo.get_all()
-        database_tickers = {entry.ticker: entry for entry in database_entries if entry.ticker}
+        database_tickers = {entry.ticker: entry for entry in ticker_directory_repo.iter_all() if entry.ticker}
         logger.info(f"Found {len(database_tickers)} ticker directory entries currently in database")
         
         # 4. Process tickers from ticker_summary and persist changes immediately
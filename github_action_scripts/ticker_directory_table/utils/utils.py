@@ -126,10 +126,12 @@ def process_tickers_and_build_sync_plan(
             batch_num = (i // BATCH_SIZE) + 1
             
             try:
-                # Bulk update status to INACTIVE
-                rows_updated = ticker_directory_repo.bulk_update_status(batch_tickers, TickerDirectoryStatus.INACTIVE)
-                logger.info(f"Batch {batch_num}/{total_update_batches}: Updated {rows_updated} entries to INACTIVE")
-                sync_result.to_update_to_inactive.extend(batch_tickers)
+                # Bulk update status to INACTIVE; the updated rows come back in the same statement
+                updated_entries = ticker_directory_repo.bulk_update_status_returning(batch_tickers, TickerDirectoryStatus.INACTIVE)
+                logger.info(f"Batch {batch_num}/{total_update_batches}: Updated {len(updated_entries)} entries to INACTIVE")
+                for entry in updated_entries:
+                    database_tickers[entry.ticker] = entry
+                    sync_result.to_update_to_inactive.append(entry.ticker)
             except Exception as e:
                 logger.error(f"Batch {batch_num}: Failed to update entries: {e}")
                 raise
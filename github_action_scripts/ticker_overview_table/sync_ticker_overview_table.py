@@ -79,8 +79,8 @@ def check_database_connectivity(
         
         # Test ticker_overview table
         try:
-            overview_count = ticker_overview_repo.count()
-            logger.info(f"✓ ticker_overview table accessible with {overview_count} existing records")
+            overview_count = ticker_overview_repo.count(approximate=True)
+            logger.info(f"✓ ticker_overview table accessible with ~{overview_count} existing records")
             return True
         except Exception as e:
             logger.error(f"✗ ticker_overview table validation failed: {e}")
@@ -169,8 +169,7 @@ def main():
         
         # 1. Fetch ticker symbols from ticker_summary table (already validated)
         logger.info("Fetching ticker symbols from ticker_summary table...")
-        ticker_summaries = ticker_summary_repo.get_all()
-        ticker_symbols = [ts.ticker for ts in ticker_summaries]
+        ticker_symbols = [ts.ticker for ts in ticker_summary_repo.iter_all()]
         logger.info(f"Loaded {len(ticker_symbols)} ticker symbols from ticker_summary table")
         
         if not ticker_symbols:
@@ -179,8 +178,7 @@ def main():
         
         # 2. Get current database state
         logger.info("Retrieving current database state...")
-        database_ticker_overview_list = ticker_overview_repo.get_all()
-        database_ticker_overviews = {to.ticker: to for to in database_ticker_overview_list}
+        database_ticker_overviews = {to.ticker: to for to in ticker_overview_repo.iter_all()}
         logger.info(f"Found {len(database_ticker_overviews)} ticker overviews currently in database")
         
         # 3. Create a single asynchronous user-managed session and reuse across batches
@@ -166,8 +166,7 @@ def main():
         
         # 2. Get current database state
         logger.info("Retrieving current database state...")
-        database_ticker_summary_list = ticker_summary_repo.get_all()
-        database_ticker_summaries = {ts.ticker: ts for ts in database_ticker_summary_list}
+        database_ticker_summaries = {ts.ticker: ts for ts in ticker_summary_repo.iter_all()}
         logger.info(f"Found {len(database_ticker_summaries)} ticker summaries currently in database")
         
         # create a single asynchronous user-managed session and reuse across batches
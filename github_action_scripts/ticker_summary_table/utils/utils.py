@@ -267,12 +267,15 @@ def process_tickers_and_persist_summaries(
         batch_ciks: Dict[str, int] = {}
         ciks_to_insert: List[CikLookup] = []
         
+        # Check which CIKs already exist in the database with one query for the batch
+        existing_ciks = cik_lookup_repo.get_many_by_cik(
+            list({cik for cik, _ in batch_cik_results.values()})
+        )
+        
         for ticker, (cik, company_name) in batch_cik_results.items():
             batch_ciks[ticker] = cik
             
-            # Check if CIK exists in database
-            existing_cik = cik_lookup_repo.get_by_cik(cik)
-            if existing_cik is None:
+            if cik not in existing_ciks:
                 # Need to insert this CIK
                 company_name_search = normalize_company_name_for_search(company_name)
                 ciks_to_insert.append(CikLookup(